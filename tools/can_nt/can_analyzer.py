@@ -12,6 +12,7 @@ DESCRIPTION
     summarize bus activity.
 """
 
+import heapq
 from dataclasses import dataclass, field
 from collections import Counter, deque
 from typing import Any, Deque, Dict, Optional, Set
@@ -37,9 +38,12 @@ class _IdLiveState:
         NAME
             ingest - Update counters and change mask with a new frame.
         """
-        if self.count > 0:
-            for i in range(min(8, len(self.last_data), len(data))):
-                if self.last_data[i] != data[i]:
+        last_data = self.last_data
+        if self.count > 0 and data != last_data:
+            # Most status frames repeat their payload; only walk the bytes
+            # when something actually changed.
+            for i in range(min(8, len(last_data), len(data))):
+                if last_data[i] != data[i]:
                     self.changing_mask |= (1 << i)
         self.last_data = data
         self.last_t = t
@@ -89,8 +93,9 @@ class CanLiveAnalyzer:
         self.frame_count += 1
         self.byte_count += len(data)
 
-        st = self.states.get(can_id)
-        if st is None:
+        try:
+            st = self.states[can_id]
+        except KeyError:
             st = _IdLiveState(can_id=can_id, first_t=t, last_t=t)
             self.states[can_id] = st
         st.ingest(t, data)
@@ -108,7 +113,7 @@ class CanLiveAnalyzer:
             summary - Build a summary snapshot of bus health and top talkers.
 
         PARAMETERS
-            now: Current wall-clock time (seconds).
+            now: Current monotonic time (seconds).
             stale_s: Age threshold for stale IDs.
             top_n: Number of top IDs to include by rate.
 
@@ -119,18 +124,21 @@ class CanLiveAnalyzer:
         fps = self.frame_count / uptime if uptime > 0 else 0.0
         bps = self.byte_count / uptime if uptime > 0 else 0.0
 
-        seen = self.seen_ids()
-        missing = sorted(self.expected_ids - seen)
-        stale = sorted(cid for cid, st in self.states.items() if (now - st.last_t) > stale_s)
+        states = self.states
+        missing = sorted(self.expected_ids.difference(states))
+        stale = sorted(cid for cid, st in states.items() if (now - st.last_t) > stale_s)
 
-        top = sorted(self.states.values(), key=lambda s: s.hz(), reverse=True)[:top_n]
+        # Rate each ID once; nlargest keeps the stable order of sorted()[:n]
+        # without sorting every ID on a busy bus.
+        rated = [(st.hz(), st) for st in states.values()]
+        top = heapq.nlargest(top_n, rated, key=lambda item: item[0])
 
         return {
             "bus": {
                 "uptime_s": round(uptime, 3),
                 "fps": round(fps, 2),
                 "bytes_per_s": round(bps, 2),
-                "unique_ids": len(seen),
+                "unique_ids": len(states),
             },
             "health": {
                 "missing": [hex(x) for x in missing],
@@ -139,10 +147,10 @@ class CanLiveAnalyzer:
             "top": [
                 {
                     "id": hex(st.can_id),
-                    "hz": round(st.hz(), 2),
+                    "hz": round(hz, 2),
                     "last": st.last_data.hex(),
                     "changing": [i for i in range(8) if (st.changing_mask >> i) & 1],
                 }
-                for st in top
+                for hz, st in top
             ],
         }
@@ -55,11 +55,22 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable port selection prompt when multiple matches are found",
     )
+    parser.add_argument(
+        "--port-cache",
+        action="store_true",
+        help="Reuse an auto-detect result from the last 10 s instead of enumerating serial ports",
+    )
     parser.add_argument(
         "--list-ports",
         action="store_true",
         help="List available serial ports and exit",
     )
+    parser.add_argument(
+        "--serial-low-latency",
+        action="store_true",
+        help="Ask the serial driver for low-latency reads before opening slcan "
+        "(Linux/macOS; USB-serial adapters with a latency timer).",
+    )
 
     parser.add_argument("--rio", default="172.22.11.2")
     parser.add_argument(
@@ -174,6 +185,17 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Publish devices seen on the bus that are not in the profile as UNKNOWN.",
     )
+    parser.add_argument(
+        "--publish-device-arrays",
+        action="store_true",
+        help="Also publish per-device metrics as parallel arrays under can/devices.",
+    )
+    parser.add_argument(
+        "--filter-profile",
+        action="store_true",
+        help="Only receive frames from profile devices and expected IDs (CAN acceptance "
+        "filter). Unprofiled devices are not seen, logged, or published.",
+    )
     parser.add_argument(
         "--dump-profile",
         default="",
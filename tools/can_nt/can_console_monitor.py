@@ -15,7 +15,6 @@ SIDE EFFECTS
     Opens sockets, optional rotating log files, and publishes to NT.
 """
 
-import json
 import logging
 import threading
 from dataclasses import dataclass
@@ -23,6 +22,23 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .can_json import load_json_file
+
+# Summary keys under console/, and per-event / per-scope count keys below it.
+_CONSOLE_KEYS = (
+    "reset",
+    "lastPublish",
+    "activeCount",
+    "totalCount",
+    "rulesLoaded",
+    "linesReceived",
+    "linesMatched",
+    "packetsReceived",
+    "lastSource",
+)
+_EVENT_KEYS = ("Active", "Count", "LastSeen", "Message", "Severity")
+_COUNT_KEYS = ("warnCount", "errorCount", "fatalCount")
+
 
 @dataclass
 class ConsoleRule:
@@ -92,6 +108,11 @@ class ConsoleMonitor:
         self._bus_fault_window_s = 5.0
         self._bus_fault_min_devices = 2
         self._published_keys: set[Tuple[Optional[int], str]] = set()
+        # NT entries resolved once per console table / event key / count scope.
+        self._console_table: Optional[Tuple[Any, Any]] = None
+        self._console_entries: Dict[str, Any] = {}
+        self._event_entries: Dict[Tuple[Optional[int], str], Tuple[Any, ...]] = {}
+        self._count_entries: Dict[Optional[int], Tuple[Any, ...]] = {}
         self._reset_requested = False
         self._init_logger(debug_log_path, debug_log_max_mb, debug_log_max_files)
         self._load_rules()
@@ -148,8 +169,7 @@ class ConsoleMonitor:
         """
         self._rules.clear()
         try:
-            raw = Path(self._rules_path).read_text(encoding="utf-8")
-            payload = json.loads(raw)
+            payload = load_json_file(self._rules_path)
         except Exception as exc:
             print(f"WARNING: Failed to load console rules '{self._rules_path}': {exc}")
             return
@@ -497,34 +517,34 @@ class ConsoleMonitor:
         for entry in entries:
             if entry.active and (now - entry.last_seen) > self._timeout_s:
                 entry.active = False
-        console_table = table.getSubTable("console")
-        console_table.getEntry("reset").setBoolean(False)
-        reset_entry = console_table.getEntry("reset")
+        console_table = self._console_table_for(table)
+        console = self._console_entries
+        reset_entry = console["reset"]
+        reset_entry.setBoolean(False)
         if reset_entry.getBoolean(False) or self._reset_requested:
             self._reset_requested = False
             self._reset_console_state(console_table)
             reset_entry.setBoolean(False)
         active_count = sum(1 for e in entries if e.active)
-        console_table.getEntry("lastPublish").setDouble(float(now))
-        console_table.getEntry("activeCount").setDouble(float(active_count))
-        console_table.getEntry("totalCount").setDouble(float(len(entries)))
-        console_table.getEntry("rulesLoaded").setDouble(float(len(self._rules)))
-        console_table.getEntry("linesReceived").setDouble(float(self._lines_received))
-        console_table.getEntry("linesMatched").setDouble(float(self._lines_matched))
-        console_table.getEntry("packetsReceived").setDouble(float(self._packets_received))
-        console_table.getEntry("lastSource").setString(self._last_addr or "")
+        console["lastPublish"].setDouble(float(now))
+        console["activeCount"].setDouble(float(active_count))
+        console["totalCount"].setDouble(float(len(entries)))
+        console["rulesLoaded"].setDouble(float(len(self._rules)))
+        console["linesReceived"].setDouble(float(self._lines_received))
+        console["linesMatched"].setDouble(float(self._lines_matched))
+        console["packetsReceived"].setDouble(float(self._packets_received))
+        console["lastSource"].setString(self._last_addr or "")
         device_counts: Dict[int, Dict[str, int]] = {}
         system_counts = {"WARN": 0, "ERROR": 0, "FATAL": 0}
         for entry in entries:
-            if entry.device_id is not None:
-                base = console_table.getSubTable("devices").getSubTable(str(entry.device_id)).getSubTable(entry.event_type)
-            else:
-                base = console_table.getSubTable("system").getSubTable(entry.event_type)
-            base.getEntry("Active").setBoolean(entry.active)
-            base.getEntry("Count").setDouble(float(entry.count))
-            base.getEntry("LastSeen").setDouble(float(entry.last_seen))
-            base.getEntry("Message").setString(entry.last_message)
-            base.getEntry("Severity").setString(entry.severity)
+            active, count, last_seen, message, severity = self._event_entries_for(
+                console_table, entry.device_id, entry.event_type
+            )
+            active.setBoolean(entry.active)
+            count.setDouble(float(entry.count))
+            last_seen.setDouble(float(entry.last_seen))
+            message.setString(entry.last_message)
+            severity.setString(entry.severity)
             self._published_keys.add((entry.device_id, entry.event_type))
             if entry.active:
                 severity = entry.severity.upper()
@@ -535,17 +555,73 @@ class ConsoleMonitor:
                 else:
                     if severity in system_counts:
                         system_counts[severity] += max(1, entry.count)
-        devices_table = console_table.getSubTable("devices")
         for device_id, counts in device_counts.items():
-            base = devices_table.getSubTable(str(device_id))
-            base.getEntry("warnCount").setDouble(float(counts["WARN"]))
-            base.getEntry("errorCount").setDouble(float(counts["ERROR"]))
-            base.getEntry("fatalCount").setDouble(float(counts["FATAL"]))
-        system_table = console_table.getSubTable("system")
-        system_table.getEntry("warnCount").setDouble(float(system_counts["WARN"]))
-        system_table.getEntry("errorCount").setDouble(float(system_counts["ERROR"]))
-        system_table.getEntry("fatalCount").setDouble(float(system_counts["FATAL"]))
+            warn, error, fatal = self._count_entries_for(console_table, device_id)
+            warn.setDouble(float(counts["WARN"]))
+            error.setDouble(float(counts["ERROR"]))
+            fatal.setDouble(float(counts["FATAL"]))
+        warn, error, fatal = self._count_entries_for(console_table, None)
+        warn.setDouble(float(system_counts["WARN"]))
+        error.setDouble(float(system_counts["ERROR"]))
+        fatal.setDouble(float(system_counts["FATAL"]))
 
+    def _console_table_for(self, table):
+        """
+        NAME
+            _console_table_for - Return the cached console subtable of table.
+
+        SIDE EFFECTS
+            On a new table, resolves the console/ summary entries and drops
+            entries cached for the previous table.
+        """
+        if self._console_table is None or self._console_table[0] is not table:
+            console_table = table.getSubTable("console")
+            self._console_table = (table, console_table)
+            self._console_entries = {key: console_table.getEntry(key) for key in _CONSOLE_KEYS}
+            self._event_entries.clear()
+            self._count_entries.clear()
+        return self._console_table[1]
+
+    def _event_entries_for(self, console_table, device_id: Optional[int], event_type: str) -> Tuple[Any, ...]:
+        """
+        NAME
+            _event_entries_for - Return the cached entries for one console event.
+
+        RETURNS
+            (Active, Count, LastSeen, Message, Severity) entries under
+            console/devices/<id>/<event> for device events, otherwise
+            console/system/<event>.
+        """
+        key = (device_id, event_type)
+        entries = self._event_entries.get(key)
+        if entries is None:
+            if device_id is not None:
+                base = console_table.getSubTable("devices").getSubTable(str(device_id)).getSubTable(event_type)
+            else:
+                base = console_table.getSubTable("system").getSubTable(event_type)
+            entries = tuple(base.getEntry(name) for name in _EVENT_KEYS)
+            self._event_entries[key] = entries
+        return entries
+
+    def _count_entries_for(self, console_table, device_id: Optional[int]) -> Tuple[Any, ...]:
+        """
+        NAME
+            _count_entries_for - Return the cached severity count entries.
+
+        RETURNS
+            (warnCount, errorCount, fatalCount) entries under
+            console/devices/<id> for a device, or console/system for None.
+        """
+        entries = self._count_entries.get(device_id)
+        if entries is None:
+            if device_id is not None:
+                base = console_table.getSubTable("devices").getSubTable(str(device_id))
+            else:
+                base = console_table.getSubTable("system")
+            entries = tuple(base.getEntry(name) for name in _COUNT_KEYS)
+            self._count_entries[device_id] = entries
+        return entries
+
     def snapshot_entries(self) -> List[ConsoleEntry]:
         """
         NAME
@@ -568,15 +644,14 @@ class ConsoleMonitor:
         with self._lock:
             self._entries.clear()
         for device_id, event_type in list(self._published_keys):
-            if device_id is not None:
-                base = console_table.getSubTable("devices").getSubTable(str(device_id)).getSubTable(event_type)
-            else:
-                base = console_table.getSubTable("system").getSubTable(event_type)
-            base.getEntry("Active").setBoolean(False)
-            base.getEntry("Count").setDouble(0.0)
-            base.getEntry("LastSeen").setDouble(0.0)
-            base.getEntry("Message").setString("")
-            base.getEntry("Severity").setString("")
+            active, count, last_seen, message, severity = self._event_entries_for(
+                console_table, device_id, event_type
+            )
+            active.setBoolean(False)
+            count.setDouble(0.0)
+            last_seen.setDouble(0.0)
+            message.setString("")
+            severity.setString("")
         self._published_keys.clear()
         self._lines_received = 0
         self._lines_matched = 0
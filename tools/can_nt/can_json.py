@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+"""
+NAME
+    can_json.py - JSON file loading shared by profile and console config.
+
+SYNOPSIS
+    from tools.can_nt.can_json import load_json_file
+
+DESCRIPTION
+    Reads a JSON config file as bytes and parses it with the stdlib json
+    module. orjson is not used: it turns integers wider than 64 bits into
+    floats and rejects NaN/Infinity, so configs could load differently
+    depending on what is installed.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    NAME
+        load_json_file - Read and parse a JSON file.
+
+    PARAMETERS
+        path: File path to read.
+
+    RETURNS
+        Parsed JSON payload.
+
+    ERRORS
+        Raises OSError when the file cannot be read and json.JSONDecodeError
+        (a ValueError) when the content is not valid JSON.
+    """
+    with open(path, "rb") as handle:
+        return json.loads(handle.read())
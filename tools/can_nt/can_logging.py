@@ -17,6 +17,18 @@ import struct
 import time
 
 
+# Write buffer for PCAPNG files and pipes. Frames are small, so a larger buffer
+# turns many per-frame writes into occasional block writes; pipes are flushed
+# on every main-loop wake that left bytes pending, and stop() flushes the tail.
+_FILE_BUFFER_BYTES = 1 << 16
+
+# Precompiled layouts for the per-frame blocks.
+_BLOCK_HEADER = struct.Struct("<II")  # block type, total length
+_BLOCK_FOOTER = struct.Struct("<I")  # total length
+_EPB_HEADER = struct.Struct("<IIIII")  # interface, ts high, ts low, cap len, orig len
+_SOCKETCAN_HEADER = struct.Struct(">IBBBB")  # can_id, len, flags, reserved x2
+
+
 class PcapLogger:
     """
     NAME
@@ -58,9 +70,10 @@ class PcapLogger:
                     path=None,
                     comment=self._pcapng_comment,
                     file_obj=pipe_file,
-                    flush_each_block=True,
                 )
                 self._logger.start()
+                # Hand Wireshark the header blocks right away.
+                self._logger.flush()
             elif self._path_is_pcapng():
                 self._logger = _PcapngWriter(self.path, self._pcapng_comment)
                 self._logger.start()
@@ -159,6 +172,25 @@ class PcapLogger:
         payload = bytes([0x4D, 0x41, 0x52, 0x4B, key_byte, counter_byte, extra_low, extra_high])
         return self.write_can_frame(timestamp_s, marker_id, payload, True, False)
 
+    def flush(self) -> None:
+        """
+        NAME
+            flush - Push buffered frames to the destination.
+
+        DESCRIPTION
+            Live pipe output is buffered like file output; the bridge calls
+            this on every main-loop wake so frames, markers, and headers reach
+            Wireshark promptly without a write syscall per frame. Nothing is
+            written when no blocks are pending.
+        """
+        flush = getattr(self._logger, "flush", None)
+        if not callable(flush):
+            return
+        try:
+            flush()
+        except Exception:
+            pass
+
     def stop(self) -> None:
         """
         NAME
@@ -202,13 +234,13 @@ class _PcapngWriter:
         path: str | None,
         comment: str = "",
         file_obj=None,
-        flush_each_block: bool = False,
     ):
         self._path = path
         self._file = file_obj
         self._comment = comment
-        self._flush_each_block = flush_each_block
         self._close_on_stop = file_obj is None
+        # True when blocks were written since the last flush().
+        self._pending = False
 
     def start(self) -> None:
         """
@@ -216,7 +248,7 @@ class _PcapngWriter:
             start - Open file/stream and write header blocks.
         """
         if self._file is None:
-            self._file = open(self._path, "wb")
+            self._file = open(self._path, "wb", buffering=_FILE_BUFFER_BYTES)
         self._write_shb(self._comment)
         self._write_idb()
 
@@ -230,6 +262,19 @@ class _PcapngWriter:
         payload = self._build_socketcan_payload(msg)
         self._write_epb(payload, self._timestamp_us(msg))
 
+    def flush(self) -> None:
+        """
+        NAME
+            flush - Flush buffered blocks to the file or pipe.
+
+        NOTES
+            No-op when nothing was written since the last flush, so callers
+            can flush every loop iteration on a quiet bus.
+        """
+        if self._file is not None and self._pending:
+            self._pending = False
+            self._file.flush()
+
     def stop(self) -> None:
         """
         NAME
@@ -321,8 +366,7 @@ class _PcapngWriter:
         ts_high = (ts_us >> 32) & 0xFFFFFFFF
         ts_low = ts_us & 0xFFFFFFFF
         cap_len = len(packet_data)
-        epb_header = struct.pack("<IIII", 0, ts_high, ts_low, cap_len)
-        epb_header += struct.pack("<I", cap_len)
+        epb_header = _EPB_HEADER.pack(0, ts_high, ts_low, cap_len, cap_len)
         block_body = epb_header + self._pad4(packet_data)
         self._write_block(self._BLOCK_EPB, block_body)
 
@@ -335,18 +379,20 @@ class _PcapngWriter:
             return
         total_len = 12 + len(block_body)
         total_len += (-total_len) % 4
-        header = struct.pack("<II", block_type, total_len)
-        footer = struct.pack("<I", total_len)
         padding = b"\x00" * ((total_len - 12) - len(block_body))
+        block = b"".join(
+            (
+                _BLOCK_HEADER.pack(block_type, total_len),
+                block_body,
+                padding,
+                _BLOCK_FOOTER.pack(total_len),
+            )
+        )
         try:
-            self._file.write(header)
-            self._file.write(block_body)
-            self._file.write(padding)
-            self._file.write(footer)
-            if self._flush_each_block:
-                self._file.flush()
+            self._file.write(block)
         except Exception:
             pass
+        self._pending = True
 
     def _pad4(self, payload: bytes) -> bytes:
         """
@@ -380,32 +426,29 @@ class _PcapngWriter:
         NAME
             _build_socketcan_payload - Encode a python-can Message to SocketCAN.
         """
-        can_id = int(getattr(msg, "arbitration_id", 0))
-        if getattr(msg, "is_extended_id", False):
+        # Direct attribute reads: python-can Message defines all of these,
+        # and this runs once per logged frame.
+        can_id = msg.arbitration_id
+        if msg.is_extended_id:
             can_id |= self._CAN_EFF_FLAG
-        if getattr(msg, "is_remote_frame", False):
+        is_remote = msg.is_remote_frame
+        if is_remote:
             can_id |= self._CAN_RTR_FLAG
-        if getattr(msg, "is_error_frame", False):
+        if msg.is_error_frame:
             can_id |= self._CAN_ERR_FLAG
 
-        data = bytes(getattr(msg, "data", b"") or b"")
-        dlc = getattr(msg, "dlc", None)
-        if dlc is None:
-            dlc = len(data)
-        if getattr(msg, "is_remote_frame", False):
-            data = b""
+        dlc = msg.dlc
+        data = b"" if is_remote else bytes(msg.data)
 
         fd_flags = 0
-        if getattr(msg, "is_fd", False):
+        if msg.is_fd:
             fd_flags |= self._CANFD_FDF
-            if getattr(msg, "bitrate_switch", False):
+            if msg.bitrate_switch:
                 fd_flags |= self._CANFD_BRS
-            if getattr(msg, "error_state_indicator", False):
+            if msg.error_state_indicator:
                 fd_flags |= self._CANFD_ESI
 
-        header = struct.pack(">IBBB", can_id, dlc & 0xFF, fd_flags & 0xFF, 0)
-        header += b"\x00"
-        return header + data
+        return _SOCKETCAN_HEADER.pack(can_id, dlc & 0xFF, fd_flags & 0xFF, 0, 0) + data
 
     def _build_socketcan_payload_raw(
         self,
@@ -432,9 +475,7 @@ class _PcapngWriter:
             data_bytes = b""
         dlc = len(data_bytes)
 
-        header = struct.pack(">IBBB", can_id, dlc & 0xFF, 0, 0)
-        header += b"\x00"
-        return header + data_bytes
+        return _SOCKETCAN_HEADER.pack(can_id, dlc & 0xFF, 0, 0, 0) + data_bytes
 
 
 def _normalize_pipe_name(name: str) -> str:
@@ -506,4 +547,4 @@ def _open_named_pipe_writer(pipe_name: str):
             raise RuntimeError(f"ConnectNamedPipe failed (err={err}) for {pipe_name}")
 
     fd = msvcrt.open_osfhandle(handle, os.O_WRONLY)
-    return os.fdopen(fd, "wb", buffering=0)
+    return os.fdopen(fd, "wb", buffering=_FILE_BUFFER_BYTES)
@@ -20,6 +20,7 @@ ERRORS
 from __future__ import annotations
 
 import queue
+import sys
 import threading
 import time
 from typing import Iterable, Optional, Tuple, List, Dict, Any
@@ -27,24 +28,85 @@ from typing import Iterable, Optional, Tuple, List, Dict, Any
 from .can_analyzer import CanLiveAnalyzer
 from .can_cli import build_parser
 from .can_console_monitor import ConsoleMonitor
-from .can_frc_defs import decode_frc_ext_id_full, classify_frame, uses_status_presence
+from .can_frc_defs import classify_frame, uses_status_presence
 from ..can_inventory.can_inventory import dump_api_inventory, print_inventory_diff
-from .can_nt_client import publish_updates, setup_nt
-from .can_nt_publish import decode_frc_ext_id
+from .can_nt_client import NtConnectionMonitor, publish_updates, setup_nt
+from .can_nt_publish import DeviceArrayPublisher, DevicePublisher, HealthPublisher, PresenceTracker
 from .can_pcap import build_pcap_comment, setup_pcap, handle_marker_keys
-from .can_ports import list_ports, maybe_auto_channel
+from .can_ports import list_ports, maybe_auto_channel, set_serial_low_latency
 from .can_profiles import get_profile
 from .can_profiles_dump import dump_seen_ids, dump_profile, dump_can_config
 from .can_reporting import (
     build_device_label_map,
     build_summary_extra,
-    format_frame_line,
+    format_frame_body,
     print_or_dump_nt_keys,
     print_summary,
 )
-from .can_state import SnifferState
+from .can_rx import CanRxWorker
+from .can_state import SnifferState, profile_can_filters
 from .can_tx import start_tx_if_requested
 
+# Upper bounds for one RX drain pass before the timers are checked again.
+RX_BATCH_MAX_FRAMES = 256
+RX_BATCH_MAX_S = 0.001
+
+# Longest wait for frames on an idle bus; keys, console, and dump timers are
+# checked at least this often. The wait is shortened to the next publish.
+RX_IDLE_WAIT_S = 0.05
+
+# Minimum period between NT writes (device, health, and console entries) while
+# the NT client has no server connection. Printing keeps the publish period.
+NT_DISCONNECTED_PUBLISH_PERIOD_S = 1.0
+
+# Minimum spacing between NT flush() calls. Flushing faster than the ntcore
+# dispatcher period (5 ms) keeps pushing its next send out and can stall
+# writes; ticks inside this window are sent by the periodic NT update.
+NT_FLUSH_MIN_INTERVAL_S = 0.006
+
+
+def _new_frame_info(
+    arb_id: int,
+    now: float,
+    state: SnifferState,
+) -> Tuple[int, bool, bool, int]:
+    """
+    NAME
+        _new_frame_info - Resolve per-ID data for a newly seen arbitration ID.
+
+    DESCRIPTION
+        The device slot, status/control classification, and (device, API)
+        pair counters all depend only on the arbitration ID. The main loop
+        calls this once per ID and caches the result, so later frames skip
+        decoding and the rule-table scan entirely.
+
+    PARAMETERS
+        arb_id: Arbitration ID of the frame.
+        now: Current monotonic time (seconds), recorded as the pair's first time.
+        state: SnifferState holding the device and pair tables.
+
+    RETURNS
+        (slot, is_status, is_control, pair_slot).
+
+    SIDE EFFECTS
+        Allocates DeviceTable and PairTable slots when missing.
+    """
+    mfg = (arb_id >> 16) & 0xFF
+    dtype = (arb_id >> 24) & 0x1F
+    api_class = (arb_id >> 10) & 0x3F
+    api_index = (arb_id >> 6) & 0x0F
+    did = arb_id & 0x3F
+    slot = state.device_table.add_arb_id(arb_id)
+    is_status, is_control = classify_frame(
+        arb_id=arb_id,
+        manufacturer=mfg,
+        device_type=dtype,
+        api_class=api_class,
+        api_index=api_index,
+    )
+    pair_slot = state.pair_table.add((mfg, dtype, did, api_class, api_index), arb_id, now)
+    return slot, is_status, is_control, pair_slot
+
 
 def _maybe_handle_dumps(
     args,
@@ -67,8 +129,8 @@ def _maybe_handle_dumps(
 
     PARAMETERS
         args: Parsed CLI arguments with dump settings.
-        now: Current wall-clock time (seconds).
-        start: Process start time (seconds).
+        now: Current monotonic time (seconds).
+        start: Loop start time on the same clock (seconds).
         analyzer: Live analyzer for seen IDs.
         state: SnifferState carrying observed pairs and timestamps.
         devices: Profile device list for context.
@@ -92,10 +154,10 @@ def _maybe_handle_dumps(
         print(f"Dumped observed arbitration IDs to {args.dump_can_expected_ids}")
         return True
     if args.dump_profile and (now - start) >= args.dump_profile_after:
-        seen_keys = sorted(state.last_seen.keys())
+        seen_keys = sorted(state.device_table.seen_keys())
         profile_name = args.dump_profile_name
         if not profile_name:
-            profile_name = time.strftime("sniffer_%Y%m%d_%H%M%S", time.localtime(now))
+            profile_name = time.strftime("sniffer_%Y%m%d_%H%M%S", time.localtime(now + state.wall_offset))
         dump_profile(
             args.dump_profile,
             profile_name,
@@ -111,7 +173,7 @@ def _maybe_handle_dumps(
             args.interface,
             args.channel,
             args.bitrate,
-            state.pair_stats,
+            state.pair_table.as_stats(),
             source="can_nt_bridge",
             robot_ip=args.rio,
         )
@@ -162,7 +224,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         return channel_status
 
     if args.list_keys or args.dump_nt:
-        print_or_dump_nt_keys(devices, args.list_keys, args.dump_nt)
+        print_or_dump_nt_keys(devices, args.list_keys, args.dump_nt, args.publish_device_arrays)
         return 0
     if args.dump_can_config:
         dump_can_config(args.dump_can_config, args, devices)
@@ -178,8 +240,22 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     # Delayed imports so --help still works without packages installed
     import can  # type: ignore
 
+    if args.serial_low_latency and args.interface == "slcan":
+        set_serial_low_latency(channel)
+
+    can_filters = None
+    if args.filter_profile:
+        can_filters = profile_can_filters(devices, expected_ids)
+        if args.publish_unknown or args.dump_profile_include_unknown:
+            print("WARNING: --filter-profile hides unprofiled devices; unknown-device output will be empty.")
+
     try:
-        bus = can.Bus(interface=args.interface, channel=channel, bitrate=args.bitrate)
+        bus = can.Bus(
+            interface=args.interface,
+            channel=channel,
+            bitrate=args.bitrate,
+            can_filters=can_filters,
+        )
     except Exception as exc:
         print(
             "ERROR: Failed to open CAN bus "
@@ -199,6 +275,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             return 2
 
     nt, table = setup_nt(args)
+    nt_monitor = NtConnectionMonitor(nt) if nt is not None else None
 
     console_monitor = None
     if args.console_monitor:
@@ -229,6 +306,27 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
 
     analyzer = CanLiveAnalyzer(expected_ids=expected_ids)
     state = SnifferState()
+    state.wall_offset = time.time() - time.monotonic()
+    wall_offset = state.wall_offset
+    state.device_table.add_devices(devices)
+    device_table = state.device_table
+    device_last_seen = device_table.last_seen
+    device_status_seen = device_table.status_last_seen
+    device_control_seen = device_table.control_last_seen
+    device_msg_count = device_table.msg_count
+    device_slot_labels = device_table.labels
+    pair_last = state.pair_table.last
+    pair_count = state.pair_table.count
+    presence = PresenceTracker(device_table, uses_status_presence)
+    device_publisher = None
+    health_publisher = None
+    device_array_publisher = None
+    if table is not None:
+        health_publisher = HealthPublisher(table)
+        device_publisher = DevicePublisher(table, device_table, presence, wall_offset)
+        device_publisher.prepare(devices)
+        if args.publish_device_arrays:
+            device_array_publisher = DeviceArrayPublisher(table, device_table, presence, wall_offset)
     stop_requested = False
     state.last_marker_ts = 0.0
     marker_keys = {"0", "1", "2", "3", "4", "m", "q", "h"}
@@ -271,15 +369,54 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         if args.tx_seq:
             print("TX control: press [space] to stop transmission.")
 
-    start = time.time()
+    start = time.monotonic()
     last_publish = 0.0
     last_summary = 0.0
-    startup_summary_done = False
+    # Publish work runs only once this deadline passes; between publishes the
+    # loop pays a single comparison instead of re-entering publish_updates.
+    next_publish = 0.0
+    publish_period = args.publish_period
+    disconnected_publish_period = max(publish_period, NT_DISCONNECTED_PUBLISH_PERIOD_S)
+    nt_connected = True
+    last_nt_write = 0.0
+    last_flush = 0.0
+    if nt is not None and publish_period < NT_FLUSH_MIN_INTERVAL_S:
+        print(
+            f"WARNING: --publish-period {publish_period} is below {NT_FLUSH_MIN_INTERVAL_S}s; "
+            "NT flushes are limited to that interval."
+        )
+    startup_summary_after = args.startup_summary_after
+    startup_summary_done = (startup_summary_after <= 0.0)
+    # One-shot dump timers only need checking when a dump was requested.
+    dumps_pending = bool(args.dump_can_expected_ids or args.dump_profile or args.dump_api_inventory)
     tx_thread = start_tx_if_requested(args, bus, can, tx_stop)
 
+    # Per-frame settings, hoisted out of the RX loop as plain locals.
+    pcap_enabled = bool(args.pcap or args.pcap_pipe)
+    pcap_live = bool(args.pcap_pipe)
+    print_any = args.print_any
+    print_status = args.print_status
+    print_control = args.print_control
+    print_frames = print_any or print_status or print_control
+    print_can_id = args.print_can_id
+    print_device_id = args.print_device_id
+    print_mfg = args.print_mfg
+    print_type = args.print_type
+    analyzer_ingest = analyzer.ingest
+    monotonic = time.monotonic
+    # arb_id -> (slot, is_status, is_control, pair slot); see _new_frame_info.
+    frame_info: Dict[int, Tuple[int, bool, bool, int]] = {}
+
+    rx = CanRxWorker(bus, state)
+    rx.start()
+    get_batch = rx.get_batch
+    # --print-frames lines for the current wake, written to stdout in one call.
+    frame_lines: List[str] = []
+    add_frame_line = frame_lines.append
+
     try:
         while True:
-            now = time.time()
+            now = monotonic()
 
             stop_requested = handle_marker_keys(
                 args=args,
@@ -293,171 +430,171 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             if stop_requested:
                 break
 
-            if _maybe_handle_dumps(args, now, start, analyzer, state, devices):
+            if dumps_pending and _maybe_handle_dumps(args, now, start, analyzer, state, devices):
                 return 0
 
-            if (
-                not startup_summary_done
-                and args.startup_summary_after > 0.0
-                and (now - start) >= args.startup_summary_after
-            ):
+            if not startup_summary_done and (now - start) >= startup_summary_after:
                 startup_summary_done = True
                 print("Startup OK.")
                 summary = analyzer.summary(now, args.stale_s, top_n=args.top_n)
-                extra = build_summary_extra(summary, devices, analyzer, state, bus, args.bitrate)
-                print_summary(summary, now, device_labels, extra)
-
-            try:
-                msg = bus.recv(timeout=0.05)
-                state.open_ok = True
-            except Exception:
-                state.read_errors += 1
-                state.open_ok = False
-                msg = None
-
-            if msg is not None:
-                if args.pcap or args.pcap_pipe:
-                    if not pcap.log(msg, timestamp_s=now):
-                        state.pcap_errors += 1
-
-                arb_id = int(msg.arbitration_id)
-                data = bytes(getattr(msg, "data", b"") or b"")
-
-                analyzer.ingest(now, arb_id, data)
-
-                mfg, dtype, did = decode_frc_ext_id(arb_id)
-                _, _, api_class, api_index, _ = decode_frc_ext_id_full(arb_id)
-                key = (mfg, dtype, did)
-                state.last_seen[key] = now
-                state.msg_count[key] = state.msg_count.get(key, 0) + 1
-
-                is_status, is_control = classify_frame(
-                    arb_id=arb_id,
-                    manufacturer=mfg,
-                    device_type=dtype,
-                    api_class=api_class,
-                    api_index=api_index,
-                )
-                if is_status:
-                    state.status_last_seen[key] = now
-                if is_control:
-                    state.control_last_seen[key] = now
-
-                print_id_match = (args.print_can_id == -1 or arb_id == args.print_can_id)
-                print_dev_match = (args.print_device_id == -1 or did == args.print_device_id)
-                print_mfg_match = (args.print_mfg == -1 or mfg == args.print_mfg)
-                print_type_match = (args.print_type == -1 or dtype == args.print_type)
-
-                label = device_labels.get((mfg, dtype, did), "")
-                if (
-                    args.print_any
-                    and print_id_match
-                    and print_dev_match
-                    and print_mfg_match
-                    and print_type_match
-                ):
-                    print(
-                        format_frame_line(
-                            "frame",
-                            arb_id,
-                            mfg,
-                            dtype,
-                            did,
-                            api_class,
-                            api_index,
-                            data,
-                            label,
-                        )
-                    )
-                if (
-                    args.print_status
-                    and is_status
-                    and print_id_match
-                    and print_dev_match
-                    and print_mfg_match
-                    and print_type_match
-                ):
-                    print(
-                        format_frame_line(
-                            "status",
-                            arb_id,
-                            mfg,
-                            dtype,
-                            did,
-                            api_class,
-                            api_index,
-                            data,
-                            label,
-                        )
-                    )
-                if (
-                    args.print_control
-                    and is_control
-                    and print_id_match
-                    and print_dev_match
-                    and print_mfg_match
-                    and print_type_match
-                ):
-                    print(
-                        format_frame_line(
-                            "control",
-                            arb_id,
-                            mfg,
-                            dtype,
-                            did,
-                            api_class,
-                            api_index,
-                            data,
-                            label,
-                        )
-                    )
-
-                pair_key = (mfg, dtype, did, api_class, api_index)
-                stats = state.pair_stats.get(pair_key)
-                if stats is None:
-                    stats = {"first": now, "last": now, "count": 0.0, "arb_id": arb_id}
-                    state.pair_stats[pair_key] = stats
-                stats["last"] = now
-                stats["count"] += 1.0
-
-                state.total_frames += 1
-                state.period_frames += 1
-                state.last_frame_time = now
+                extra = build_summary_extra(summary, state, bus, args.bitrate)
+                print_summary(summary, now + wall_offset, device_labels, extra)
+
+            # Wake for the next publish deadline instead of overshooting it.
+            wait_s = next_publish - now
+            if wait_s > RX_IDLE_WAIT_S:
+                wait_s = RX_IDLE_WAIT_S
+            batch = get_batch(timeout=wait_s)
+            # get_batch may have blocked for up to wait_s; take the time again
+            # so the drain deadline and publish check start from the wake-up.
+            now = monotonic()
+            batch_frames = 0
+            batch_deadline = now + RX_BATCH_MAX_S
+
+            while batch:
+                for rx_time, msg in batch:
+                    if pcap_enabled:
+                        if not pcap.log(msg, timestamp_s=rx_time + wall_offset):
+                            state.pcap_errors += 1
+
+                    # python-can Messages always carry these attributes.
+                    arb_id = msg.arbitration_id
+                    data = bytes(msg.data)
+
+                    analyzer_ingest(rx_time, arb_id, data)
+
+                    try:
+                        slot, is_status, is_control, pair = frame_info[arb_id]
+                    except KeyError:
+                        info = _new_frame_info(arb_id, rx_time, state)
+                        frame_info[arb_id] = info
+                        slot, is_status, is_control, pair = info
+                    device_last_seen[slot] = rx_time
+                    device_msg_count[slot] += 1
+                    if is_status:
+                        device_status_seen[slot] = rx_time
+                    if is_control:
+                        device_control_seen[slot] = rx_time
+                    pair_last[pair] = rx_time
+                    pair_count[pair] += 1
+
+                    if print_frames and (
+                        print_any or (print_status and is_status) or (print_control and is_control)
+                    ):
+                        # Same layout as decode_frc_ext_id_full; only needed for printing.
+                        mfg = (arb_id >> 16) & 0xFF
+                        dtype = (arb_id >> 24) & 0x1F
+                        api_class = (arb_id >> 10) & 0x3F
+                        api_index = (arb_id >> 6) & 0x0F
+                        did = arb_id & 0x3F
+                        if (
+                            (print_can_id == -1 or arb_id == print_can_id)
+                            and (print_device_id == -1 or did == print_device_id)
+                            and (print_mfg == -1 or mfg == print_mfg)
+                            and (print_type == -1 or dtype == print_type)
+                        ):
+                            # Format once; each enabled kind only adds its tag.
+                            body = format_frame_body(
+                                arb_id,
+                                mfg,
+                                dtype,
+                                did,
+                                api_class,
+                                api_index,
+                                data,
+                                device_slot_labels[slot],
+                            )
+                            if print_any:
+                                add_frame_line("[frame] " + body)
+                            if print_status and is_status:
+                                add_frame_line("[status] " + body)
+                            if print_control and is_control:
+                                add_frame_line("[control] " + body)
+
+                batch_frames += len(batch)
+                last_rx_time = rx_time
+                if batch_frames >= RX_BATCH_MAX_FRAMES or monotonic() >= batch_deadline:
+                    break
+                batch = get_batch(timeout=0.0)
+
+            if frame_lines:
+                frame_lines.append("")
+                sys.stdout.write("\n".join(frame_lines))
+                frame_lines.clear()
+
+            if batch_frames:
+                state.total_frames += batch_frames
+                state.period_frames += batch_frames
+                state.last_frame_time = last_rx_time
+
+            if pcap_live:
+                # Also pushes markers written above on a quiet bus.
+                pcap.flush()
 
             if console_monitor is not None:
-                console_monitor.poll(now)
-
-            last_publish, last_summary = publish_updates(
-                args=args,
-                now=now,
-                last_publish=last_publish,
-                last_summary=last_summary,
-                analyzer=analyzer,
-                state=state,
-                devices=devices,
-                labels=device_labels,
-                table=table,
-                bus=bus,
-                console_monitor=console_monitor,
-                uses_status_presence=uses_status_presence,
-            )
+                console_monitor.poll(now + wall_offset)
+
+            if now >= next_publish:
+                if nt_monitor is not None:
+                    # Back off NT writes while the RIO is unreachable; on
+                    # reconnect, resend everything so the server sees a
+                    # complete picture.
+                    was_connected = nt_connected
+                    nt_connected = nt_monitor.is_connected()
+                    if nt_connected and not was_connected:
+                        if device_publisher is not None:
+                            device_publisher.invalidate()
+                        if health_publisher is not None:
+                            health_publisher.invalidate()
+                        if device_array_publisher is not None:
+                            device_array_publisher.invalidate()
+                write_nt = nt_connected or (now - last_nt_write) >= disconnected_publish_period
+                if write_nt:
+                    last_nt_write = now
+                last_publish, last_summary = publish_updates(
+                    args=args,
+                    now=now,
+                    last_publish=last_publish,
+                    last_summary=last_summary,
+                    analyzer=analyzer,
+                    state=state,
+                    devices=devices,
+                    labels=device_labels,
+                    table=table,
+                    bus=bus,
+                    console_monitor=console_monitor,
+                    presence=presence,
+                    device_publisher=device_publisher,
+                    health_publisher=health_publisher,
+                    device_array_publisher=device_array_publisher,
+                    write_nt=write_nt,
+                )
+                if nt_connected and nt is not None and (now - last_flush) >= NT_FLUSH_MIN_INTERVAL_S:
+                    # Send this tick's writes together instead of waiting
+                    # for the next periodic NT update.
+                    nt.flush()
+                    last_flush = now
+                next_publish = last_publish + publish_period
 
     except KeyboardInterrupt:
         print("Stopping (Ctrl+C)...")
     finally:
-        now = time.time()
+        now = time.monotonic()
         if console_monitor is not None:
             console_monitor.stop()
         try:
             summary = analyzer.summary(now, stale_s=args.stale_s, top_n=args.top_n)
             print("=== Final Summary ===")
-            extra = build_summary_extra(summary, devices, analyzer, state, bus, args.bitrate)
-            print_summary(summary, now, device_labels, extra)
+            extra = build_summary_extra(summary, state, bus, args.bitrate)
+            print_summary(summary, now + state.wall_offset, device_labels, extra)
         except Exception as exc:
             print(f"WARNING: Failed to print summary on exit: {exc}")
 
         key_stop.set()
         tx_stop.set()
+        rx.stop()
+        if nt_monitor is not None:
+            nt_monitor.close()
         try:
             pcap.stop()
             print("PCAP logger stopped.")
@@ -5,11 +5,11 @@ NAME
     can_nt_client.py - NetworkTables client setup and publish loop helpers.
 
 SYNOPSIS
-    from tools.can_nt.can_nt_client import setup_nt, publish_updates
+    from tools.can_nt.can_nt_client import setup_nt, publish_updates, NtConnectionMonitor
 
 DESCRIPTION
-    Encapsulates NT client creation and periodic publishing of device/summary
-    data for the CAN diagnostics tool.
+    Encapsulates NT client creation, connection tracking, and periodic
+    publishing of device/summary data for the CAN diagnostics tool.
 """
 
 import json
@@ -17,7 +17,12 @@ from typing import Dict, List, Tuple
 
 from .can_analyzer import CanLiveAnalyzer
 from .can_console_monitor import ConsoleMonitor
-from .can_nt_publish import publish_devices
+from .can_nt_publish import (
+    DeviceArrayPublisher,
+    DevicePublisher,
+    HealthPublisher,
+    PresenceTracker,
+)
 from .can_reporting import print_status_transitions, build_summary_extra, print_summary
 from .can_state import SnifferState, merge_unknown_devices
 
@@ -47,6 +52,68 @@ def setup_nt(args):
     return nt, table
 
 
+class NtConnectionMonitor:
+    """
+    NAME
+        NtConnectionMonitor - Track NT connection state from listener events.
+
+    SYNOPSIS
+        monitor = NtConnectionMonitor(nt)
+        if monitor.is_connected(): ...
+        monitor.close()
+
+    DESCRIPTION
+        Registers an ntcore connection listener once, so the publish loop
+        reads a cached flag instead of calling isConnected() on every tick.
+        If the listener cannot be registered, is_connected() falls back to
+        polling isConnected().
+
+    NOTES
+        The listener callback runs on an ntcore thread and only stores a bool.
+    """
+    def __init__(self, nt) -> None:
+        self._nt = nt
+        self._connected = False
+        self._handle = None
+        try:
+            from ntcore import EventFlags
+
+            self._connected_flag = EventFlags.kConnected
+            self._handle = nt.addConnectionListener(True, self._on_event)
+        except Exception as exc:
+            print(f"WARNING: NT connection listener unavailable ({exc}); polling isConnected().")
+            self._handle = None
+
+    def _on_event(self, event) -> None:
+        """
+        NAME
+            _on_event - Record connect/disconnect events from ntcore.
+        """
+        self._connected = bool(event.is_(self._connected_flag))
+
+    def is_connected(self) -> bool:
+        """
+        NAME
+            is_connected - Return whether the NT client is connected.
+        """
+        if self._handle is None:
+            return bool(self._nt.isConnected())
+        return self._connected
+
+    def close(self) -> None:
+        """
+        NAME
+            close - Remove the connection listener.
+        """
+        if self._handle is None:
+            return
+        try:
+            self._nt.removeListener(self._handle)
+        except Exception:
+            pass
+        self._handle = None
+
+
 def publish_updates(
     args,
     now: float,
@@ -59,7 +126,11 @@ def publish_updates(
     table,
     bus,
     console_monitor: ConsoleMonitor | None,
-    uses_status_presence,
+    presence: PresenceTracker,
+    device_publisher: DevicePublisher | None,
+    health_publisher: HealthPublisher | None,
+    device_array_publisher: DeviceArrayPublisher | None = None,
+    write_nt: bool = True,
 ) -> Tuple[float, float]:
     """
     NAME
@@ -67,7 +138,7 @@ def publish_updates(
 
     PARAMETERS
         args: Parsed CLI args controlling publish cadence and features.
-        now: Current wall-clock time (seconds).
+        now: Current monotonic time (seconds).
         last_publish: Last publish timestamp (seconds).
         last_summary: Last summary print timestamp (seconds).
         analyzer: Live analyzer for summary data.
@@ -77,7 +148,12 @@ def publish_updates(
         table: NetworkTables base table (bringup/diag) or None.
         bus: CAN bus instance for extra summary context.
         console_monitor: Optional NetConsole monitor.
-        uses_status_presence: Predicate for presence source selection.
+        presence: Shared per-device presence codes, updated here once per publish.
+        device_publisher: Cached per-device NT writer, or None without NT.
+        health_publisher: Cached can/pc and summary writer, or None without NT.
+        device_array_publisher: can/devices array writer, or None when disabled.
+        write_nt: False skips the device, array, health, and console NT writes
+            for this tick (NT disconnected backoff); printing still runs.
 
     RETURNS
         Updated (last_publish, last_summary) timestamps.
@@ -92,53 +168,57 @@ def publish_updates(
     frames_per_sec = (state.period_frames / publish_dt) if publish_dt > 0 else 0.0
     last_frame_age = (now - state.last_frame_time) if state.last_frame_time > 0 else -1.0
 
-    if table is not None:
-        publish_devices(
-            table=table,
-            devices=merge_unknown_devices(devices, state.last_seen, args.publish_unknown),
-            last_seen=state.last_seen,
-            status_last_seen=state.status_last_seen,
-            control_last_seen=state.control_last_seen,
-            uses_status_presence=uses_status_presence,
-            msg_count=state.msg_count,
-            now=now,
-            timeout_s=args.timeout,
-        )
+    if not write_nt:
+        device_publisher = None
+        health_publisher = None
+        device_array_publisher = None
+
+    # Every NT value written this tick carries the same timestamp.
+    nt_time = health_publisher.nt_timestamp() if health_publisher is not None else 0
+
+    # Presence is evaluated once and shared by the NT writer and the printer.
+    if device_publisher is not None:
+        publish_devices = merge_unknown_devices(devices, state.device_table, args.publish_unknown)
+        presence.update(publish_devices, now, args.timeout)
+        device_publisher.publish(devices=publish_devices, now=now, nt_time=nt_time)
+        if device_array_publisher is not None:
+            device_array_publisher.publish(devices=publish_devices, now=now, nt_time=nt_time)
+    elif args.print_publish:
+        presence.update(devices, now, args.timeout)
 
     if args.print_publish:
         print_status_transitions(
             devices=devices,
-            last_seen=state.last_seen,
-            status_last_seen=state.status_last_seen,
-            control_last_seen=state.control_last_seen,
-            now=now,
-            timeout_s=args.timeout,
-            last_status=state.last_status,
-            uses_status_presence=uses_status_presence,
+            device_table=state.device_table,
+            presence=presence,
         )
 
-    if args.publish_can_summary and table is not None:
-        summary = analyzer.summary(now, stale_s=args.stale_s, top_n=args.top_n)
-        table.getEntry("can/summary/json").setString(
-            json.dumps(summary, separators=(",", ":"))
+    # The analyzer summary is built at most once per tick and shared by the
+    # NT summary key and the console summary line.
+    summary = None
+    if health_publisher is not None:
+        if args.publish_can_summary:
+            summary = analyzer.summary(now, stale_s=args.stale_s, top_n=args.top_n)
+            health_publisher.publish_summary(json.dumps(summary, separators=(",", ":")), nt_time)
+        health_publisher.publish(
+            heartbeat=state.heartbeat,
+            open_ok=state.open_ok,
+            frames_per_sec=frames_per_sec,
+            frames_total=state.total_frames,
+            read_errors=state.read_errors,
+            last_frame_age=last_frame_age,
+            nt_time=nt_time,
         )
-
-    if table is not None:
-        table.getEntry("can/pc/heartbeat").setDouble(float(state.heartbeat))
-        table.getEntry("can/pc/openOk").setBoolean(state.open_ok)
-        table.getEntry("can/pc/framesPerSec").setDouble(float(frames_per_sec))
-        table.getEntry("can/pc/framesTotal").setDouble(float(state.total_frames))
-        table.getEntry("can/pc/readErrors").setDouble(float(state.read_errors))
-        table.getEntry("can/pc/lastFrameAgeSec").setDouble(float(last_frame_age))
-    if console_monitor is not None:
-        console_monitor.publish(table, now)
+    if console_monitor is not None and write_nt:
+        console_monitor.publish(table, now + state.wall_offset)
 
     state.period_frames = 0
     state.heartbeat += 1
     if args.print_summary_period and (now - last_summary) >= args.print_summary_period:
-        summary = analyzer.summary(now, stale_s=args.stale_s, top_n=args.top_n)
-        extra = build_summary_extra(summary, devices, analyzer, state, bus, args.bitrate)
-        print_summary(summary, now, labels, extra)
+        if summary is None:
+            summary = analyzer.summary(now, stale_s=args.stale_s, top_n=args.top_n)
+        extra = build_summary_extra(summary, state, bus, args.bitrate)
+        print_summary(summary, now + state.wall_offset, labels, extra)
         last_summary = now
 
     last_publish = now
@@ -5,14 +5,126 @@ NAME
     can_nt_publish.py - NetworkTables publishing helpers for CAN devices.
 
 SYNOPSIS
-    from tools.can_nt.can_nt_publish import publish_devices
+    from tools.can_nt.can_nt_publish import DevicePublisher, HealthPublisher, PresenceTracker
+    from tools.can_nt.can_nt_publish import DeviceArrayPublisher
 
 DESCRIPTION
-    Encodes per-device presence/age metrics into NetworkTables keys under
-    bringup/diag/dev.
+    Evaluates per-device presence, encodes presence/age metrics into
+    NetworkTables keys under bringup/diag/dev, and publishes PC-side bridge
+    health under bringup/diag/can.
 """
 
-from typing import Any, Dict, List, Tuple
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .can_state import DeviceTable
+
+# Leaf keys published under dev/<mfg>/<type>/<id>, in key-inventory order.
+DEVICE_NT_FIELDS = (
+    "label",
+    "status",
+    "ageSec",
+    "msgCount",
+    "lastSeen",
+    "presenceSource",
+    "presenceConfidence",
+    "trafficAgeSec",
+    "statusAgeSec",
+    "manufacturer",
+    "deviceType",
+    "deviceId",
+)
+
+
+def _no_nt_clock() -> int:
+    """
+    NAME
+        _no_nt_clock - Fallback NT clock used when ntcore has no _now().
+
+    RETURNS
+        0, which typed publishers treat as "stamp with the current time".
+    """
+    return 0
+
+
+def _resolve_nt_clock():
+    """
+    NAME
+        _resolve_nt_clock - Look up the ntcore clock function once.
+
+    RETURNS
+        ntcore._now (NT time in microseconds), or _no_nt_clock when this
+        ntcore build does not expose it.
+    """
+    try:
+        from ntcore import _now  # type: ignore
+    except ImportError:
+        return _no_nt_clock
+    return _now
+
+
+# Presence states as small integer codes. Each code maps to the
+# (presenceSource, presenceConfidence, status) strings published for it.
+PRESENCE_NONE = 0
+PRESENCE_TRAFFIC_STALE = 1
+PRESENCE_CONTROL_ONLY = 2
+PRESENCE_STATUS = 3
+PRESENCE_TRAFFIC = 4
+PRESENCE_STRINGS: Tuple[Tuple[str, str, str], ...] = (
+    ("NONE", "NONE", "MISSING"),
+    ("TRAFFIC", "LOW", "MISSING"),
+    ("CONTROL_ONLY", "LOW", "CONTROL_ONLY"),
+    ("STATUS", "HIGH", "OK"),
+    ("TRAFFIC", "LOW", "OK"),
+)
+
+
+# Array keys published under can/devices by DeviceArrayPublisher. Index i of
+# every array refers to the same device.
+DEVICE_ARRAY_NT_FIELDS = (
+    "manufacturer",
+    "deviceType",
+    "deviceId",
+    "label",
+    "status",
+    "msgCount",
+    "ageSec",
+    "lastSeen",
+)
+
+
+def presence_age(presence: int, traffic_age: float, status_age: float) -> float:
+    """
+    NAME
+        presence_age - Pick the published ageSec for a presence code.
+
+    RETURNS
+        status_age for status-based presence, -1.0 when never seen, and
+        traffic_age otherwise.
+    """
+    if presence == PRESENCE_STATUS:
+        return status_age
+    if presence == PRESENCE_NONE:
+        return -1.0
+    return traffic_age
+
+
+def device_nt_paths(manufacturer: int, device_type: int, device_id: int) -> Dict[str, str]:
+    """
+    NAME
+        device_nt_paths - Build the per-device NT key paths.
+
+    PARAMETERS
+        manufacturer: FRC manufacturer code.
+        device_type: FRC device type code.
+        device_id: Device ID (0-63).
+
+    RETURNS
+        Dict mapping each DEVICE_NT_FIELDS name to "dev/<mfg>/<type>/<id>/<name>".
+    """
+    base = f"dev/{manufacturer}/{device_type}/{device_id}"
+    return {name: f"{base}/{name}" for name in DEVICE_NT_FIELDS}
 
 
 def decode_frc_ext_id(arb_id: int) -> Tuple[int, int, int]:
@@ -36,90 +148,485 @@ def decode_frc_ext_id(arb_id: int) -> Tuple[int, int, int]:
     return manufacturer, device_type, device_id
 
 
-def publish_devices(
-    table,
-    devices: List[Dict[str, Any]],
-    last_seen: Dict[Tuple[int, int, int], float],
-    status_last_seen: Dict[Tuple[int, int, int], float],
-    control_last_seen: Dict[Tuple[int, int, int], float],
-    uses_status_presence,
-    msg_count: Dict[Tuple[int, int, int], int],
-    now: float,
-    timeout_s: float,
-) -> None:
+class PresenceTracker:
     """
     NAME
-        publish_devices - Write per-device presence metrics to NetworkTables.
+        PresenceTracker - Per-device presence codes, evaluated once per tick.
 
-    PARAMETERS
-        table: NetworkTables base table (bringup/diag).
-        devices: Profile device list with metadata.
-        last_seen: Last traffic timestamp per device.
-        status_last_seen: Last status-frame timestamp per device.
-        control_last_seen: Last control-frame timestamp per device.
-        uses_status_presence: Predicate for status-based presence confidence.
-        msg_count: Total message counts per device.
-        now: Current wall-clock time (seconds).
-        timeout_s: Presence timeout threshold in seconds.
-
-    SIDE EFFECTS
-        Writes multiple NetworkTables entries under dev/<mfg>/<type>/<id>.
+    SYNOPSIS
+        presence = PresenceTracker(device_table, uses_status_presence)
+        presence.update(devices, now, timeout_s)
+        code = presence.codes[slot]
+
+    DESCRIPTION
+        Classifies each device into one of the PRESENCE_* codes from its
+        traffic, status, and control timestamps. The NT publisher and the
+        --print-publish transition printer both read the codes from one
+        update() pass instead of each re-deriving them.
+
+        Devices whose manufacturer/type prefer status frames are OK only
+        while status frames are fresh; otherwise any traffic within the
+        timeout counts.
+    """
+    def __init__(self, device_table: DeviceTable, uses_status_presence) -> None:
+        self._device_table = device_table
+        self._uses_status_presence = uses_status_presence
+        self._prefer_status: Dict[int, bool] = {}
+        self.codes = array("b")
+
+    def update(self, devices: List[Dict[str, Any]], now: float, timeout_s: float) -> None:
+        """
+        NAME
+            update - Recompute presence codes for the given devices.
+
+        PARAMETERS
+            devices: Device list (profile devices plus any UNKNOWN entries).
+            now: Current monotonic time (seconds).
+            timeout_s: Presence timeout threshold in seconds.
+        """
+        device_table = self._device_table
+        last_seen = device_table.last_seen
+        status_last_seen = device_table.status_last_seen
+        control_last_seen = device_table.control_last_seen
+        msg_count = device_table.msg_count
+        prefer_cache = self._prefer_status
+        codes = self.codes
+        for spec in devices:
+            key = (spec["manufacturer"], spec["device_type"], spec["device_id"])
+            slot = device_table.add(*key)
+            if slot >= len(codes):
+                codes.extend(bytes(slot + 1 - len(codes)))
+            if not msg_count[slot]:
+                codes[slot] = PRESENCE_NONE
+                continue
+            prefer_status = prefer_cache.get(slot)
+            if prefer_status is None:
+                prefer_status = bool(self._uses_status_presence(key[0], key[1]))
+                prefer_cache[slot] = prefer_status
+            # Timestamps are 0.0 until seen.
+            traffic_ts = last_seen[slot]
+            if prefer_status:
+                status_ts = status_last_seen[slot]
+                if status_ts and (now - status_ts) < timeout_s:
+                    code = PRESENCE_STATUS
+                elif control_last_seen[slot] and traffic_ts:
+                    code = PRESENCE_CONTROL_ONLY
+                elif traffic_ts:
+                    code = PRESENCE_TRAFFIC_STALE
+                else:
+                    code = PRESENCE_NONE
+            elif traffic_ts and (now - traffic_ts) < timeout_s:
+                code = PRESENCE_TRAFFIC
+            else:
+                code = PRESENCE_NONE
+            codes[slot] = code
+
+
+@dataclass
+class _DeviceEntries:
+    """
+    NAME
+        _DeviceEntries - Cached NT4 typed publishers for one device.
+    """
+    slot: int
+    status: Any
+    age_sec: Any
+    msg_count: Any
+    last_seen: Any
+    presence_source: Any
+    presence_confidence: Any
+    traffic_age_sec: Any
+    status_age_sec: Any
+    prev_presence: Optional[int] = None
+    prev_count: Optional[int] = None
+    prev_last_seen: Optional[float] = None
+    prev_age: Optional[float] = None
+    prev_traffic_age: Optional[float] = None
+    prev_status_age: Optional[float] = None
+
+
+class DevicePublisher:
     """
-    for spec in devices:
+    NAME
+        DevicePublisher - Write per-device presence metrics to NetworkTables.
+
+    DESCRIPTION
+        Resolves the dev/<mfg>/<type>/<id>/... topics once per device and
+        writes the static fields (label, manufacturer, deviceType, deviceId)
+        at that time. The changing fields get NT4 typed publishers, so each
+        publish pass is a set() on a cached handle with no per-tick path
+        formatting, lookups, or generic Value boxing.
+
+        Values are only written when they differ from the last published
+        value. Ages are published and compared unrounded, since robot-side
+        scoring uses thresholds finer than 0.1 s.
+
+        Presence comes from a PresenceTracker that the caller updates before
+        each publish. Device timestamps are monotonic; wall_offset converts
+        them back to wall-clock time for the published lastSeen value.
+    """
+    def __init__(
+        self,
+        table,
+        device_table: DeviceTable,
+        presence: PresenceTracker,
+        wall_offset: float = 0.0,
+    ) -> None:
+        self._table = table
+        self._device_table = device_table
+        self._presence = presence
+        self._wall_offset = wall_offset
+        self._entries: Dict[int, _DeviceEntries] = {}
+
+    def _entries_for(self, spec: Dict[str, Any]) -> _DeviceEntries:
+        """
+        NAME
+            _entries_for - Return cached entries for a device, creating them once.
+
+        SIDE EFFECTS
+            On first use, publishes the device's static label and identifiers.
+        """
         key = (spec["manufacturer"], spec["device_type"], spec["device_id"])
-        traffic_ts = last_seen.get(key)
-        status_ts = status_last_seen.get(key)
-        control_ts = control_last_seen.get(key)
-        prefer_status = uses_status_presence(key[0], key[1])
-
-        traffic_age = -1.0 if traffic_ts is None else (now - traffic_ts)
-        status_age = -1.0 if status_ts is None else (now - status_ts)
-
-        if prefer_status:
-            if status_ts is not None and status_age < timeout_s:
-                presence_source = "STATUS"
-                confidence = "HIGH"
-                status = "OK"
-                age = status_age
-            elif control_ts is not None and traffic_ts is not None:
-                presence_source = "CONTROL_ONLY"
-                confidence = "LOW"
-                status = "CONTROL_ONLY"
-                age = traffic_age
-            elif traffic_ts is not None:
-                presence_source = "TRAFFIC"
-                confidence = "LOW"
-                status = "MISSING"
-                age = traffic_age
-            else:
-                presence_source = "NONE"
-                confidence = "NONE"
-                status = "MISSING"
-                age = -1.0
-        else:
-            if traffic_ts is not None and traffic_age < timeout_s:
-                presence_source = "TRAFFIC"
-                confidence = "LOW"
-                status = "OK"
-                age = traffic_age
-            else:
-                presence_source = "NONE"
-                confidence = "NONE"
-                status = "MISSING"
-                age = -1.0
-
-        last_seen_value = traffic_ts if traffic_ts is not None else -1.0
-
-        base = f"dev/{key[0]}/{key[1]}/{key[2]}"
-        table.getEntry(f"{base}/label").setString(str(spec.get("label", "")))
-        table.getEntry(f"{base}/status").setString(status)
-        table.getEntry(f"{base}/ageSec").setDouble(float(age))
-        table.getEntry(f"{base}/msgCount").setDouble(float(msg_count.get(key, 0)))
-        table.getEntry(f"{base}/lastSeen").setDouble(float(last_seen_value))
-        table.getEntry(f"{base}/manufacturer").setDouble(float(key[0]))
-        table.getEntry(f"{base}/deviceType").setDouble(float(key[1]))
-        table.getEntry(f"{base}/deviceId").setDouble(float(key[2]))
-        table.getEntry(f"{base}/presenceSource").setString(presence_source)
-        table.getEntry(f"{base}/presenceConfidence").setString(confidence)
-        table.getEntry(f"{base}/trafficAgeSec").setDouble(float(traffic_age))
-        table.getEntry(f"{base}/statusAgeSec").setDouble(float(status_age))
+        slot = self._device_table.add(*key)
+        entries = self._entries.get(slot)
+        if entries is not None:
+            return entries
+        table = self._table
+        paths = device_nt_paths(*key)
+        table.getEntry(paths["label"]).setString(str(spec.get("label", "")))
+        table.getEntry(paths["manufacturer"]).setDouble(float(key[0]))
+        table.getEntry(paths["deviceType"]).setDouble(float(key[1]))
+        table.getEntry(paths["deviceId"]).setDouble(float(key[2]))
+        entries = _DeviceEntries(
+            slot=slot,
+            status=table.getStringTopic(paths["status"]).publish(),
+            age_sec=table.getDoubleTopic(paths["ageSec"]).publish(),
+            msg_count=table.getDoubleTopic(paths["msgCount"]).publish(),
+            last_seen=table.getDoubleTopic(paths["lastSeen"]).publish(),
+            presence_source=table.getStringTopic(paths["presenceSource"]).publish(),
+            presence_confidence=table.getStringTopic(paths["presenceConfidence"]).publish(),
+            traffic_age_sec=table.getDoubleTopic(paths["trafficAgeSec"]).publish(),
+            status_age_sec=table.getDoubleTopic(paths["statusAgeSec"]).publish(),
+        )
+        self._entries[slot] = entries
+        return entries
+
+    def invalidate(self) -> None:
+        """
+        NAME
+            invalidate - Forget last-published values.
+
+        DESCRIPTION
+            The next publish writes all changing fields regardless of what was
+            last sent. Publishers and static fields are kept; ntcore resends
+            them itself on reconnect. Used after an NT reconnect.
+        """
+        for entries in self._entries.values():
+            entries.prev_presence = None
+            entries.prev_count = None
+            entries.prev_last_seen = None
+            entries.prev_age = None
+            entries.prev_traffic_age = None
+            entries.prev_status_age = None
+
+    def prepare(self, devices: List[Dict[str, Any]]) -> None:
+        """
+        NAME
+            prepare - Resolve entries for known devices ahead of the loop.
+
+        PARAMETERS
+            devices: Profile device list.
+
+        SIDE EFFECTS
+            Publishes each device's static label and identifiers.
+        """
+        for spec in devices:
+            self._entries_for(spec)
+
+    def publish(self, devices: List[Dict[str, Any]], now: float, nt_time: int = 0) -> None:
+        """
+        NAME
+            publish - Write presence metrics for each device.
+
+        PARAMETERS
+            devices: Profile device list with metadata (plus UNKNOWN entries).
+            now: Current monotonic time (seconds).
+            nt_time: NT timestamp (microseconds) for every value; 0 for now.
+
+        NOTES
+            The PresenceTracker must already be updated for these devices.
+
+        SIDE EFFECTS
+            Writes NetworkTables entries under dev/<mfg>/<type>/<id>.
+        """
+        device_table = self._device_table
+        last_seen = device_table.last_seen
+        status_last_seen = device_table.status_last_seen
+        msg_count = device_table.msg_count
+        presence_codes = self._presence.codes
+        for spec in devices:
+            entries = self._entries_for(spec)
+            slot = entries.slot
+            count = msg_count[slot]
+            if not count and entries.prev_count == 0:
+                # Never seen and its idle state is already published; nothing
+                # can have changed. Common while most of a robot is unpowered.
+                continue
+            traffic_ts = last_seen[slot] or None
+            status_ts = status_last_seen[slot] or None
+
+            traffic_age = -1.0 if traffic_ts is None else (now - traffic_ts)
+            status_age = -1.0 if status_ts is None else (now - status_ts)
+
+            presence = presence_codes[slot]
+            age = presence_age(presence, traffic_age, status_age)
+
+            last_seen_value = (traffic_ts + self._wall_offset) if traffic_ts is not None else -1.0
+
+            prev_presence = entries.prev_presence
+            if presence != prev_presence:
+                source, confidence, status = PRESENCE_STRINGS[presence]
+                if prev_presence is None:
+                    prev_source = prev_confidence = prev_status = None
+                else:
+                    prev_source, prev_confidence, prev_status = PRESENCE_STRINGS[prev_presence]
+                if status != prev_status:
+                    entries.status.set(status, nt_time)
+                if source != prev_source:
+                    entries.presence_source.set(source, nt_time)
+                if confidence != prev_confidence:
+                    entries.presence_confidence.set(confidence, nt_time)
+                entries.prev_presence = presence
+            if count != entries.prev_count:
+                entries.msg_count.set(float(count), nt_time)
+                entries.prev_count = count
+            if last_seen_value != entries.prev_last_seen:
+                entries.last_seen.set(float(last_seen_value), nt_time)
+                entries.prev_last_seen = last_seen_value
+            if age != entries.prev_age:
+                entries.age_sec.set(float(age), nt_time)
+                entries.prev_age = age
+            if traffic_age != entries.prev_traffic_age:
+                entries.traffic_age_sec.set(float(traffic_age), nt_time)
+                entries.prev_traffic_age = traffic_age
+            if status_age != entries.prev_status_age:
+                entries.status_age_sec.set(float(status_age), nt_time)
+                entries.prev_status_age = status_age
+
+
+class DeviceArrayPublisher:
+    """
+    NAME
+        DeviceArrayPublisher - Write per-device metrics as parallel NT arrays.
+
+    DESCRIPTION
+        Opt-in companion to DevicePublisher (--publish-device-arrays). Writes
+        the can/devices/<field> arrays listed in DEVICE_ARRAY_NT_FIELDS, so a
+        dashboard can read the whole device list from a few NT values instead
+        of one topic per device and field. The per-device dev/... keys are
+        still published.
+
+        manufacturer, deviceType, deviceId, and label are written when the
+        device list changes. status, msgCount, ageSec, and lastSeen follow
+        the same rules as the per-device keys and are only written when they
+        change (ageSec compared at 0.1 s).
+    """
+    def __init__(
+        self,
+        table,
+        device_table: DeviceTable,
+        presence: PresenceTracker,
+        wall_offset: float = 0.0,
+    ) -> None:
+        self._device_table = device_table
+        self._presence = presence
+        self._wall_offset = wall_offset
+        self._manufacturer = table.getIntegerArrayTopic("can/devices/manufacturer").publish()
+        self._device_type = table.getIntegerArrayTopic("can/devices/deviceType").publish()
+        self._device_id = table.getIntegerArrayTopic("can/devices/deviceId").publish()
+        self._label = table.getStringArrayTopic("can/devices/label").publish()
+        self._status = table.getStringArrayTopic("can/devices/status").publish()
+        self._msg_count = table.getDoubleArrayTopic("can/devices/msgCount").publish()
+        self._age_sec = table.getDoubleArrayTopic("can/devices/ageSec").publish()
+        self._last_seen = table.getDoubleArrayTopic("can/devices/lastSeen").publish()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        NAME
+            invalidate - Forget last-published arrays.
+
+        DESCRIPTION
+            The next publish writes every array. Used after an NT reconnect.
+        """
+        self._prev_keys: Optional[List[Tuple[int, int, int]]] = None
+        self._prev_status: Optional[List[str]] = None
+        self._prev_msg_count: Optional[List[float]] = None
+        self._prev_age: Optional[List[float]] = None
+        self._prev_last_seen: Optional[List[float]] = None
+
+    def publish(self, devices: List[Dict[str, Any]], now: float, nt_time: int = 0) -> None:
+        """
+        NAME
+            publish - Write the can/devices arrays that changed.
+
+        PARAMETERS
+            devices: Profile device list with metadata (plus UNKNOWN entries).
+            now: Current monotonic time (seconds).
+            nt_time: NT timestamp (microseconds) for every value; 0 for now.
+
+        NOTES
+            The PresenceTracker must already be updated for these devices.
+        """
+        device_table = self._device_table
+        last_seen = device_table.last_seen
+        status_last_seen = device_table.status_last_seen
+        msg_count = device_table.msg_count
+        presence_codes = self._presence.codes
+        wall_offset = self._wall_offset
+        keys: List[Tuple[int, int, int]] = []
+        status: List[str] = []
+        counts: List[float] = []
+        ages: List[float] = []
+        ages_q: List[float] = []
+        seen: List[float] = []
+        for spec in devices:
+            key = (spec["manufacturer"], spec["device_type"], spec["device_id"])
+            slot = device_table.add(*key)
+            keys.append(key)
+            traffic_ts = last_seen[slot]
+            status_ts = status_last_seen[slot]
+            traffic_age = (now - traffic_ts) if traffic_ts else -1.0
+            status_age = (now - status_ts) if status_ts else -1.0
+            presence = presence_codes[slot]
+            age = presence_age(presence, traffic_age, status_age)
+            status.append(PRESENCE_STRINGS[presence][2])
+            counts.append(float(msg_count[slot]))
+            ages.append(age)
+            ages_q.append(round(age, 1))
+            seen.append((traffic_ts + wall_offset) if traffic_ts else -1.0)
+
+        if keys != self._prev_keys:
+            self._manufacturer.set([key[0] for key in keys], nt_time)
+            self._device_type.set([key[1] for key in keys], nt_time)
+            self._device_id.set([key[2] for key in keys], nt_time)
+            self._label.set([str(spec.get("label", "")) for spec in devices], nt_time)
+            self._prev_keys = keys
+        if status != self._prev_status:
+            self._status.set(status, nt_time)
+            self._prev_status = status
+        if counts != self._prev_msg_count:
+            self._msg_count.set(counts, nt_time)
+            self._prev_msg_count = counts
+        if ages_q != self._prev_age:
+            self._age_sec.set(ages, nt_time)
+            self._prev_age = ages_q
+        if seen != self._prev_last_seen:
+            self._last_seen.set(seen, nt_time)
+            self._prev_last_seen = seen
+
+
+class HealthPublisher:
+    """
+    NAME
+        HealthPublisher - Write PC-side bridge health and the CAN summary.
+
+    DESCRIPTION
+        Creates NT4 typed publishers for the can/pc/* and can/summary/json
+        topics once so each publish tick is a handful of set calls on cached
+        handles.
+
+        Like DevicePublisher, values are only written when they differ from
+        the last published value. The heartbeat changes every tick and is
+        always written, so dashboards can still tell the bridge is alive
+        while the bus is idle.
+    """
+    def __init__(self, table) -> None:
+        self._heartbeat = table.getDoubleTopic("can/pc/heartbeat").publish()
+        self._open_ok = table.getBooleanTopic("can/pc/openOk").publish()
+        self._frames_per_sec = table.getDoubleTopic("can/pc/framesPerSec").publish()
+        self._frames_total = table.getDoubleTopic("can/pc/framesTotal").publish()
+        self._read_errors = table.getDoubleTopic("can/pc/readErrors").publish()
+        self._last_frame_age = table.getDoubleTopic("can/pc/lastFrameAgeSec").publish()
+        self._summary_json = table.getStringTopic("can/summary/json").publish()
+        self._nt_now = _resolve_nt_clock()
+        self.invalidate()
+
+    def nt_timestamp(self) -> int:
+        """
+        NAME
+            nt_timestamp - Read the ntcore clock once for a publish pass.
+
+        RETURNS
+            Current NT time in microseconds, or 0 (meaning "now" to typed
+            publishers) when ntcore does not expose its clock.
+
+        NOTES
+            Passing one timestamp to every set() in a tick gives all values of
+            that tick the same server-side time, so dashboards see them as one
+            consistent sample.
+        """
+        return self._nt_now()
+
+    def invalidate(self) -> None:
+        """
+        NAME
+            invalidate - Forget last-published values.
+
+        DESCRIPTION
+            The next publish writes every value regardless of what was last
+            sent. Used after an NT reconnect.
+        """
+        self._prev_open_ok: Optional[bool] = None
+        self._prev_frames_per_sec: Optional[float] = None
+        self._prev_frames_total: Optional[int] = None
+        self._prev_read_errors: Optional[int] = None
+        self._prev_last_frame_age: Optional[float] = None
+        self._prev_summary_json: Optional[str] = None
+
+    def publish(
+        self,
+        heartbeat: int,
+        open_ok: bool,
+        frames_per_sec: float,
+        frames_total: int,
+        read_errors: int,
+        last_frame_age: float,
+        nt_time: int = 0,
+    ) -> None:
+        """
+        NAME
+            publish - Write the can/pc/* health values that changed.
+
+        PARAMETERS
+            nt_time: NT timestamp (microseconds) for every value; 0 for now.
+        """
+        self._heartbeat.set(float(heartbeat), nt_time)
+        if open_ok != self._prev_open_ok:
+            self._open_ok.set(open_ok, nt_time)
+            self._prev_open_ok = open_ok
+        if frames_per_sec != self._prev_frames_per_sec:
+            self._frames_per_sec.set(float(frames_per_sec), nt_time)
+            self._prev_frames_per_sec = frames_per_sec
+        if frames_total != self._prev_frames_total:
+            self._frames_total.set(float(frames_total), nt_time)
+            self._prev_frames_total = frames_total
+        if read_errors != self._prev_read_errors:
+            self._read_errors.set(float(read_errors), nt_time)
+            self._prev_read_errors = read_errors
+        if last_frame_age != self._prev_last_frame_age:
+            self._last_frame_age.set(float(last_frame_age), nt_time)
+            self._prev_last_frame_age = last_frame_age
+
+    def publish_summary(self, summary_json: str, nt_time: int = 0) -> None:
+        """
+        NAME
+            publish_summary - Write the serialized analyzer summary if it changed.
+
+        PARAMETERS
+            summary_json: Serialized analyzer summary.
+            nt_time: NT timestamp (microseconds); 0 for now.
+        """
+        if summary_json != self._prev_summary_json:
+            self._summary_json.set(summary_json, nt_time)
+            self._prev_summary_json = summary_json
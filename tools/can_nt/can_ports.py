@@ -9,10 +9,21 @@ SYNOPSIS
 
 DESCRIPTION
     Enumerates serial ports via pyserial and selects a matching CANable
-    interface, optionally prompting the user.
+    interface, optionally prompting the user. With --port-cache, auto-detect
+    results are cached briefly per user so repeated short runs skip USB
+    enumeration. Can also request low-latency mode from the serial driver
+    before the bus is opened.
 """
 
-from typing import List, Tuple
+import json
+import os
+import time
+from typing import List, Optional, Tuple
+
+from .can_json import load_json_file
+
+# Auto-detected ports are reused for this long before enumerating again.
+PORT_CACHE_TTL_S = 10.0
 
 
 def list_ports() -> List[Tuple[str, str]]:
@@ -101,6 +112,94 @@ def auto_channel(match_text: str, prompt: bool) -> Tuple[str, str]:
     return matches[0]
 
 
+def _port_cache_path() -> str:
+    """
+    NAME
+        _port_cache_path - Return the per-user auto-detect cache file path.
+
+    RETURNS
+        %LOCALAPPDATA%/can_nt_bridge/ports.json on Windows, otherwise
+        $XDG_CACHE_HOME (or ~/.cache)/can_nt_bridge/ports.json.
+    """
+    base = os.environ.get("LOCALAPPDATA", "") if os.name == "nt" else ""
+    if not base:
+        base = os.environ.get("XDG_CACHE_HOME", "") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "can_nt_bridge", "ports.json")
+
+
+def _port_exists(device: str) -> bool:
+    """
+    NAME
+        _port_exists - Check that a cached serial device is still present.
+
+    DESCRIPTION
+        The port is never opened. On Windows COM ports have no filesystem
+        path, so the device is looked up in the registry's SERIALCOMM map,
+        which lists the serial ports currently present.
+    """
+    if os.name != "nt":
+        return os.path.exists(device)
+    try:
+        import winreg
+
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DEVICEMAP\SERIALCOMM") as key:
+            index = 0
+            while True:
+                _, value, _ = winreg.EnumValue(key, index)
+                if str(value).upper() == device.upper():
+                    return True
+                index += 1
+    except OSError:
+        # EnumValue raises OSError past the last value.
+        return False
+
+
+def _load_cached_channel(match_text: str) -> Optional[Tuple[str, str]]:
+    """
+    NAME
+        _load_cached_channel - Return a fresh cached auto-detect result.
+
+    RETURNS
+        (device, description) when a cache entry for match_text is younger
+        than PORT_CACHE_TTL_S and its device still exists, otherwise None.
+    """
+    try:
+        entry = load_json_file(_port_cache_path())[match_text]
+        if (time.time() - float(entry["time"])) > PORT_CACHE_TTL_S:
+            return None
+        device = str(entry["device"])
+        desc = str(entry.get("description", ""))
+    except Exception:
+        return None
+    if not device or not _port_exists(device):
+        return None
+    return device, desc
+
+
+def _store_cached_channel(match_text: str, device: str, desc: str) -> None:
+    """
+    NAME
+        _store_cached_channel - Record an auto-detect result in the cache.
+
+    NOTES
+        Best effort; cache write failures are ignored.
+    """
+    path = _port_cache_path()
+    try:
+        cache = load_json_file(path)
+        if not isinstance(cache, dict):
+            cache = {}
+    except Exception:
+        cache = {}
+    cache[match_text] = {"device": device, "description": desc, "time": time.time()}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+
 def maybe_auto_channel(args) -> Tuple[str | None, str | None, int]:
     """
     NAME
@@ -111,14 +210,82 @@ def maybe_auto_channel(args) -> Tuple[str | None, str | None, int]:
 
     RETURNS
         (channel, description, status_code) where status_code is 0 on success.
+
+    NOTES
+        With --port-cache, a result auto-detected within the last
+        PORT_CACHE_TTL_S seconds is reused when its device still exists.
+        The cache is off by default.
     """
     channel = args.channel
     if channel:
         return channel, None, 0
+    use_cache = args.port_cache
+    if use_cache:
+        cached = _load_cached_channel(args.auto_match)
+        if cached is not None:
+            channel, channel_desc = cached
+            print(f"Auto-detected CAN channel: {channel} ({channel_desc}) [cached]")
+            return channel, channel_desc, 0
     try:
         channel, channel_desc = auto_channel(args.auto_match, not args.no_prompt)
     except Exception as exc:
         print(f"ERROR: Failed to auto-detect CAN channel: {exc}")
         return None, None, 2
     print(f"Auto-detected CAN channel: {channel} ({channel_desc})")
+    if use_cache:
+        _store_cached_channel(args.auto_match, channel, channel_desc)
     return channel, channel_desc, 0
+
+
+def set_serial_low_latency(channel: str) -> bool:
+    """
+    NAME
+        set_serial_low_latency - Request low-latency reads from the serial driver.
+
+    DESCRIPTION
+        On POSIX systems, opens the port briefly with pyserial and sets
+        ASYNC_LOW_LATENCY, which drops the latency timer of FTDI-style USB
+        serial adapters from 16 ms to 1 ms. The flag stays on the tty after
+        the port is closed, so python-can picks it up when it opens the bus.
+
+    PARAMETERS
+        channel: slcan channel, optionally with an "@baud" suffix.
+
+    RETURNS
+        True when low-latency mode was applied.
+
+    ERRORS
+        Prints a warning and returns False when pyserial is missing, the
+        platform is Windows, or the driver rejects the request.
+
+    NOTES
+        On Windows the latency timer is a driver setting (Device Manager >
+        Port Settings > Advanced) and is not changed here. CANable slcan
+        firmware enumerates as a USB CDC device, which has no latency timer.
+    """
+    if os.name == "nt":
+        print(
+            "WARNING: --serial-low-latency is not supported on Windows. "
+            "Set the adapter latency timer in Device Manager if it has one."
+        )
+        return False
+    try:
+        import serial  # type: ignore
+    except Exception:
+        print(
+            "WARNING: --serial-low-latency requires pyserial. "
+            "Install it with: py -m pip install pyserial"
+        )
+        return False
+    port_name = channel.split("@", 1)[0]
+    try:
+        port = serial.Serial(port_name)
+        try:
+            port.set_low_latency_mode(True)
+        finally:
+            port.close()
+    except Exception as exc:
+        print(f"WARNING: Failed to enable serial low-latency mode on {port_name}: {exc}")
+        return False
+    print(f"Serial low-latency mode enabled on {port_name}.")
+    return True
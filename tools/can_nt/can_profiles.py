@@ -12,10 +12,11 @@ DESCRIPTION
     device lists for the CAN diagnostics tool.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Set, Tuple
 
+from .can_json import load_json_file
+
 
 DEFAULT_PROFILE_NAME = "robot"
 PROFILE_FILE = Path(__file__).resolve().parents[2] / "src" / "main" / "deploy" / "bringup_profiles.json"
@@ -47,7 +48,7 @@ def _load_profiles() -> Tuple[str, Dict[str, List[Dict[str, Any]]]]:
         return (_fallback_default(), _fallback_profiles())
 
     try:
-        payload = json.loads(PROFILE_FILE.read_text(encoding="utf-8"))
+        payload = load_json_file(PROFILE_FILE)
     except Exception:
         return (_fallback_default(), _fallback_profiles())
 
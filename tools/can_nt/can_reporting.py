@@ -5,7 +5,7 @@ NAME
     can_reporting.py - Console/summary reporting helpers.
 
 SYNOPSIS
-    from tools.can_nt.can_reporting import print_summary, format_frame_line
+    from tools.can_nt.can_reporting import print_summary, format_frame_body
 
 DESCRIPTION
     Formats NetworkTables key inventories, status transitions, and summary
@@ -16,12 +16,29 @@ import json
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
-from .can_analyzer import CanLiveAnalyzer
-from .can_nt_publish import decode_frc_ext_id
-from .can_state import SnifferState
-
-
-def print_or_dump_nt_keys(devices, print_keys: bool, dump_path: str) -> None:
+from .can_nt_publish import (
+    DEVICE_ARRAY_NT_FIELDS,
+    PRESENCE_CONTROL_ONLY,
+    PRESENCE_STRINGS,
+    PresenceTracker,
+    decode_frc_ext_id,
+    device_nt_paths,
+)
+from .can_state import DeviceTable, SnifferState
+
+# Display names for common manufacturer and device-type codes.
+_MFG_NAMES = {
+    1: "NI",
+    4: "CTRE",
+    5: "REV",
+}
+_TYPE_NAMES = {
+    2: "MotorController",
+    8: "Pneumatics",
+}
+
+
+def print_or_dump_nt_keys(devices, print_keys: bool, dump_path: str, device_arrays: bool = False) -> None:
     """
     NAME
         print_or_dump_nt_keys - Emit or persist the published NT key list.
@@ -30,29 +47,17 @@ def print_or_dump_nt_keys(devices, print_keys: bool, dump_path: str) -> None:
         devices: Profile device list used to expand per-device keys.
         print_keys: Whether to print to stdout.
         dump_path: Optional JSON output path.
+        device_arrays: Include the --publish-device-arrays keys.
 
     SIDE EFFECTS
         Prints to stdout and/or writes a JSON file.
     """
     keys = []
     for spec in devices:
-        base = f"bringup/diag/dev/{spec['manufacturer']}/{spec['device_type']}/{spec['device_id']}"
-        keys.extend(
-            [
-                f"{base}/label",
-                f"{base}/status",
-                f"{base}/ageSec",
-                f"{base}/msgCount",
-                f"{base}/lastSeen",
-                f"{base}/presenceSource",
-                f"{base}/presenceConfidence",
-                f"{base}/trafficAgeSec",
-                f"{base}/statusAgeSec",
-                f"{base}/manufacturer",
-                f"{base}/deviceType",
-                f"{base}/deviceId",
-            ]
-        )
+        paths = device_nt_paths(spec["manufacturer"], spec["device_type"], spec["device_id"])
+        keys.extend(f"bringup/diag/{path}" for path in paths.values())
+    if device_arrays:
+        keys.extend(f"bringup/diag/can/devices/{name}" for name in DEVICE_ARRAY_NT_FIELDS)
     keys.append("bringup/diag/can/summary/json")
     keys.extend(
         [
@@ -85,38 +90,42 @@ def print_or_dump_nt_keys(devices, print_keys: bool, dump_path: str) -> None:
 
 def print_status_transitions(
     devices,
-    last_seen: Dict[Tuple[int, int, int], float],
-    status_last_seen: Dict[Tuple[int, int, int], float],
-    control_last_seen: Dict[Tuple[int, int, int], float],
-    now: float,
-    timeout_s: float,
-    last_status: Dict[Tuple[int, int, int], str],
-    uses_status_presence,
+    device_table: DeviceTable,
+    presence: PresenceTracker,
 ) -> None:
     """
     NAME
         print_status_transitions - Print device seen/missing transitions.
 
     DESCRIPTION
-        Compares current presence against cached status and prints transitions
+        Compares the status for each device's current presence code against
+        the status cached in device_table.last_status and prints transitions
         when a device crosses the timeout threshold.
 
+    NOTES
+        presence must already be updated for this tick.
+
+        The console keeps its own rule for one case: a status-preferring
+        device whose status frames went stale prints MISSING even while
+        control frames continue. NT publishes CONTROL_ONLY for it.
+
     SIDE EFFECTS
         Writes to stdout.
     """
+    codes = presence.codes
+    status_last_seen = device_table.status_last_seen
+    last_status = device_table.last_status
     for spec in devices:
         key = (spec["manufacturer"], spec["device_type"], spec["device_id"])
-        traffic_ts = last_seen.get(key)
-        status_ts = status_last_seen.get(key)
-        control_ts = control_last_seen.get(key)
-        ts = status_ts if uses_status_presence(key[0], key[1]) else traffic_ts
-        if ts is None:
-            status = "CONTROL_ONLY" if control_ts is not None else "MISSING"
+        slot = device_table.add(*key)
+        code = codes[slot]
+        if code == PRESENCE_CONTROL_ONLY and status_last_seen[slot]:
+            status = "MISSING"
         else:
-            status = "OK" if (now - ts) < timeout_s else "MISSING"
-        prev = last_status.get(key)
+            status = PRESENCE_STRINGS[code][2]
+        prev = last_status[slot]
         if prev is None:
-            last_status[key] = status
+            last_status[slot] = status
             continue
         if prev != status:
             label = spec.get("label", "")
@@ -124,7 +133,7 @@ def print_status_transitions(
                 print(f"[seen] {label} mfg={key[0]} type={key[1]} id={key[2]}")
             else:
                 print(f"[missing] {label} mfg={key[0]} type={key[1]} id={key[2]} ({status})")
-        last_status[key] = status
+        last_status[slot] = status
 
 
 def build_device_label_map(devices: List[Dict[str, Any]]) -> Dict[Tuple[int, int, int], str]:
@@ -147,8 +156,7 @@ def build_device_label_map(devices: List[Dict[str, Any]]) -> Dict[Tuple[int, int
     return labels
 
 
-def format_frame_line(
-    kind: str,
+def format_frame_body(
     arb_id: int,
     mfg: int,
     dtype: int,
@@ -160,28 +168,22 @@ def format_frame_line(
 ) -> str:
     """
     NAME
-        format_frame_line - Format a single CAN frame for console output.
+        format_frame_body - Format a CAN frame's fields without the kind tag.
+
+    DESCRIPTION
+        A frame printed as several kinds (frame/status/control) shares one
+        body; callers prepend "[kind] " per line.
 
     RETURNS
         A one-line string with identifiers, label, and data bytes.
     """
-    mfg_names = {
-        1: "NI",
-        4: "CTRE",
-        5: "REV",
-    }
-    type_names = {
-        2: "MotorController",
-        8: "Pneumatics",
-    }
-    mfg_name = mfg_names.get(mfg)
-    type_name = type_names.get(dtype)
-
+    mfg_name = _MFG_NAMES.get(mfg)
+    type_name = _TYPE_NAMES.get(dtype)
     label_text = f" {label}" if label else ""
     mfg_text = f" mfgName={mfg_name}" if mfg_name else ""
     type_text = f" typeName={type_name}" if type_name else ""
     return (
-        f"[{kind}] id=0x{arb_id:X}"
+        f"id=0x{arb_id:X}"
         f"{label_text} mfg={mfg}{mfg_text} type={dtype}{type_text} "
         f"devId={device_id} apiClass={api_class} apiIndex={api_index} "
         f"len={len(data)} data={data.hex()}"
@@ -207,17 +209,8 @@ def format_can_id(can_id_hex: str, labels: Dict[Tuple[int, int, int], str]) -> s
     mfg, dtype, did = decode_frc_ext_id(can_id)
     label = labels.get((mfg, dtype, did), "")
     label_part = f"{label} " if label else ""
-    mfg_names = {
-        1: "NI",
-        4: "CTRE",
-        5: "REV",
-    }
-    type_names = {
-        2: "MotorController",
-        8: "Pneumatics",
-    }
-    mfg_name = mfg_names.get(mfg)
-    type_name = type_names.get(dtype)
+    mfg_name = _MFG_NAMES.get(mfg)
+    type_name = _TYPE_NAMES.get(dtype)
     mfg_text = f" mfgName={mfg_name}" if mfg_name else ""
     type_text = f" typeName={type_name}" if type_name else ""
     return f"{label_part}mfg={mfg}{mfg_text} type={dtype}{type_text} id={did} can={can_id_hex}"
@@ -240,8 +233,6 @@ def get_bus_dropped(bus) -> Optional[int]:
 
 def build_summary_extra(
     summary: Dict[str, Any],
-    devices: List[Dict[str, Any]],
-    analyzer: CanLiveAnalyzer,
     state: SnifferState,
     bus,
     bitrate: int,
@@ -251,7 +242,8 @@ def build_summary_extra(
         build_summary_extra - Compute derived summary fields for printing.
 
     DESCRIPTION
-        Adds bus-load percentage and counts of seen/unknown devices.
+        Adds bus-load percentage, error and drop counters, and counts of
+        seen/unknown devices.
 
     RETURNS
         Dictionary of extra summary values.
@@ -260,19 +252,64 @@ def build_summary_extra(
     bus_load_pct = None
     if isinstance(bytes_per_s, (int, float)) and bitrate > 0:
         bus_load_pct = (bytes_per_s * 8.0 / float(bitrate)) * 100.0
-    known_keys = {(d["manufacturer"], d["device_type"], d["device_id"]) for d in devices}
-    seen_keys = {decode_frc_ext_id(cid) for cid in analyzer.seen_ids()}
-    unknown_keys = seen_keys - known_keys
+    seen_devices, unknown_devices = state.device_table.seen_counts()
     return {
         "bus_load_pct": bus_load_pct,
         "read_errors": state.read_errors,
         "pcap_errors": state.pcap_errors,
         "dropped": get_bus_dropped(bus),
-        "seen_devices": len(seen_keys),
-        "unknown_devices": len(unknown_keys),
+        "rx_dropped": state.rx_dropped,
+        "seen_devices": seen_devices,
+        "unknown_devices": unknown_devices,
     }
 
 
+# (whole second, "HH:MM:SS") for the last formatted summary time.
+_hms_cache: List[Any] = [-1, ""]
+
+
+def _format_hms(now: float) -> str:
+    """
+    NAME
+        _format_hms - Format a wall-clock time as HH:MM:SS, cached per second.
+
+    DESCRIPTION
+        Summary lines are often printed several times within one second
+        (startup, periodic, and final summaries), so localtime/strftime only
+        run when the second changes.
+    """
+    sec = int(now)
+    if sec != _hms_cache[0]:
+        _hms_cache[0] = sec
+        _hms_cache[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _hms_cache[1]
+
+
+# [labels map, {can_id_hex: format_can_id text}]; labels are static per run.
+_can_id_text_cache: List[Any] = [None, {}]
+
+
+def _can_id_text(can_id_hex: str, labels: Dict[Tuple[int, int, int], str]) -> str:
+    """
+    NAME
+        _can_id_text - Return format_can_id text, cached per CAN ID.
+
+    DESCRIPTION
+        The top-talker rows repeat the same few IDs every summary period and
+        their decoded text depends only on the ID and the label map. The
+        cache is dropped when a different label map is passed in.
+    """
+    if _can_id_text_cache[0] is not labels:
+        _can_id_text_cache[0] = labels
+        _can_id_text_cache[1] = {}
+    cache = _can_id_text_cache[1]
+    text = cache.get(can_id_hex)
+    if text is None:
+        text = format_can_id(can_id_hex, labels)
+        cache[can_id_hex] = text
+    return text
+
+
 def print_summary(
     summary,
     now: float,
@@ -290,30 +327,28 @@ def print_summary(
         extra: Derived summary fields.
 
     SIDE EFFECTS
-        Writes to stdout.
+        Writes to stdout with a single print call.
     """
     bus = summary.get("bus", {})
     health = summary.get("health", {})
     top = summary.get("top", [])
     total = bus.get("fps")
     missing = health.get("missing", [])
-    ts = time.strftime("%H:%M:%S", time.localtime(now))
+    ts = _format_hms(now)
     bus_load = extra.get("bus_load_pct")
     bus_load_text = f"{bus_load:.1f}%" if isinstance(bus_load, (int, float)) else "n/a"
     dropped = extra.get("dropped")
     dropped_text = str(dropped) if isinstance(dropped, int) else "n/a"
-    print(
+    lines = [
         f"[summary {ts}] fps={total} missing={len(missing)} top={len(top)} "
         f"busLoad={bus_load_text} readErr={extra.get('read_errors', 0)} "
         f"pcapErr={extra.get('pcap_errors', 0)} dropped={dropped_text} "
+        f"rxDrop={extra.get('rx_dropped', 0)} "
         f"seen={extra.get('seen_devices', 0)} unknown={extra.get('unknown_devices', 0)}"
-    )
+    ]
     for row in top[:5]:
         try:
-            print(
-                "  "
-                f"{format_can_id(row.get('id', ''), labels)} "
-                f"hz={row.get('hz')}"
-            )
+            lines.append(f"  {_can_id_text(row.get('id', ''), labels)} hz={row.get('hz')}")
         except Exception:
             continue
+    print("\n".join(lines))
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+"""
+NAME
+    can_rx.py - Background CAN receive thread with a bounded queue.
+
+SYNOPSIS
+    from tools.can_nt.can_rx import CanRxWorker
+
+DESCRIPTION
+    Drains the CAN bus on a dedicated thread so NT publishing, printing, and
+    logging in the main loop never delay driver reads. After each blocking
+    read the thread also collects whatever the driver has already buffered,
+    and hands the whole burst over as one list through a bounded queue. Each
+    frame is stamped with time.monotonic() as it is read, so frames handled
+    together later still keep their own receive times. When the consumer
+    falls behind, the oldest queued burst is dropped and its frames counted,
+    so memory stays bounded and the main loop always sees the most recent
+    traffic.
+"""
+
+import queue
+import threading
+import time
+
+from .can_state import SnifferState
+
+# Bursts buffered between the receive thread and the main loop. Quiet buses
+# hand over one frame per burst, so this is at least RX_QUEUE_MAX frames; at a
+# full 1 Mbit/s FRC bus (~8-9k frames/s) that is roughly half a second.
+RX_QUEUE_MAX = 4096
+
+# Upper bound on frames collected into one burst after a blocking read.
+RX_BURST_MAX = 64
+
+# Pause after a failed recv so a disconnected adapter does not spin the CPU.
+RX_ERROR_BACKOFF_S = 0.1
+
+
+class CanRxWorker:
+    """
+    NAME
+        CanRxWorker - Receive thread feeding a bounded frame queue.
+
+    SYNOPSIS
+        rx = CanRxWorker(bus, state)
+        rx.start()
+        for rx_time, msg in rx.get_batch(timeout=0.05): ...
+        rx.stop()
+
+    DESCRIPTION
+        The thread only calls bus.recv() and enqueues lists of
+        (rx_time, Message) pairs, where rx_time is time.monotonic() taken
+        right after the read: one blocking read, then non-blocking reads
+        until the driver is empty or RX_BURST_MAX frames are collected.
+        Receive errors are counted in state.read_errors and clear
+        state.open_ok; the thread keeps retrying so a transient slcan glitch
+        does not end reception. A later successful read sets open_ok again.
+
+    SIDE EFFECTS
+        Increments state.read_errors and state.rx_dropped (in frames) from the
+        receive thread. Both are plain counters read by the main loop for
+        reporting.
+    """
+    def __init__(self, bus, state: SnifferState, maxsize: int = RX_QUEUE_MAX) -> None:
+        self._bus = bus
+        self._state = state
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        NAME
+            start - Launch the receive thread.
+        """
+        self._thread = threading.Thread(target=self._run, name="can-rx", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        NAME
+            stop - Signal the receive thread to exit and wait for it.
+
+        NOTES
+            Call before bus.shutdown() so recv() is not running on a closed bus.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_batch(self, timeout: float = 0.0) -> list:
+        """
+        NAME
+            get_batch - Return the next received burst of frames.
+
+        PARAMETERS
+            timeout: Seconds to wait for a burst; 0 returns immediately.
+
+        RETURNS
+            List of (rx_time, Message) pairs in receive order, rx_time on
+            the time.monotonic() clock; empty on timeout.
+        """
+        try:
+            if timeout > 0.0:
+                return self._queue.get(timeout=timeout)
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return []
+
+    def _run(self) -> None:
+        """
+        NAME
+            _run - Receive loop executed on the worker thread.
+        """
+        bus = self._bus
+        state = self._state
+        recv = bus.recv
+        monotonic = time.monotonic
+        put = self._queue.put_nowait
+        get = self._queue.get_nowait
+        stop = self._stop
+        while not stop.is_set():
+            batch = []
+            try:
+                msg = recv(timeout=0.1)
+                while msg is not None:
+                    batch.append((monotonic(), msg))
+                    if len(batch) >= RX_BURST_MAX:
+                        break
+                    msg = recv(timeout=0.0)
+            except Exception:
+                state.read_errors += 1
+                state.open_ok = False
+                if not batch:
+                    stop.wait(RX_ERROR_BACKOFF_S)
+                    continue
+            else:
+                state.open_ok = True
+            if not batch:
+                continue
+            try:
+                put(batch)
+            except queue.Full:
+                # Latest wins: evict the oldest burst to make room.
+                try:
+                    state.rx_dropped += len(get())
+                except queue.Empty:
+                    pass
+                try:
+                    put(batch)
+                except queue.Full:
+                    state.rx_dropped += len(batch)
@@ -12,8 +12,212 @@ DESCRIPTION
     publishing.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Arbitration-ID bits that identify a device: device_type (24..28),
+# manufacturer (16..23), and device_id (0..5). API class/index are masked out.
+DEVICE_KEY_MASK = 0x1FFF003F
+
+
+def device_key(manufacturer: int, device_type: int, device_id: int) -> int:
+    """
+    NAME
+        device_key - Pack (manufacturer, type, id) into masked arb-ID form.
+
+    RETURNS
+        Integer equal to (arb_id & DEVICE_KEY_MASK) for frames from the device.
+    """
+    return ((device_type & 0x1F) << 24) | ((manufacturer & 0xFF) << 16) | (device_id & 0x3F)
+
+
+def profile_can_filters(devices: Iterable[Dict[str, Any]], expected_ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    NAME
+        profile_can_filters - Build python-can acceptance filters for a profile.
+
+    PARAMETERS
+        devices: Profile device list.
+        expected_ids: Exact arbitration IDs the profile expects.
+
+    RETURNS
+        can_filters list accepting every API frame from each profile device
+        (matched on DEVICE_KEY_MASK) plus each expected arbitration ID.
+
+    NOTES
+        Interfaces with hardware filtering drop other frames in the driver;
+        python-can applies the same filters in software otherwise.
+    """
+    filters: List[Dict[str, Any]] = []
+    seen = set()
+    for spec in devices:
+        key = device_key(int(spec["manufacturer"]), int(spec["device_type"]), int(spec["device_id"]))
+        if key not in seen:
+            seen.add(key)
+            filters.append({"can_id": key, "can_mask": DEVICE_KEY_MASK, "extended": True})
+    for arb_id in sorted(expected_ids):
+        if (arb_id & DEVICE_KEY_MASK) not in seen:
+            filters.append({"can_id": arb_id, "can_mask": 0x1FFFFFFF, "extended": True})
+    return filters
+
+
+class DeviceTable:
+    """
+    NAME
+        DeviceTable - Per-device counters stored as parallel arrays.
+
+    DESCRIPTION
+        Assigns each device an integer slot once, keyed by its masked
+        arbitration ID, and keeps timestamps and message counts in flat arrays
+        indexed by that slot. The per-frame path is one dict lookup plus array
+        stores instead of tuple construction and several dict updates.
+
+        Profile devices are added up front so their slots follow profile order
+        and occupy slots [0, known_count); devices first seen on the bus are
+        appended on demand.
+
+    NOTES
+        A timestamp of 0.0 means the device has not been seen.
+    """
+    def __init__(self) -> None:
+        self.slot_of: Dict[int, int] = {}
+        self.keys: List[Tuple[int, int, int]] = []
+        self.last_seen = array("d")
+        self.status_last_seen = array("d")
+        self.control_last_seen = array("d")
+        self.msg_count = array("q")
+        # Profile label per slot ("" for unlabeled and unprofiled devices).
+        self.labels: List[str] = []
+        # Last status printed by --print-publish transitions; None until first pass.
+        self.last_status: List[Optional[str]] = []
+        self.known_count = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, manufacturer: int, device_type: int, device_id: int) -> int:
+        """
+        NAME
+            add - Return the slot for a device, allocating it if needed.
+        """
+        key = device_key(manufacturer, device_type, device_id)
+        slot = self.slot_of.get(key)
+        if slot is not None:
+            return slot
+        slot = len(self.keys)
+        self.slot_of[key] = slot
+        self.keys.append((manufacturer, device_type, device_id))
+        self.last_seen.append(0.0)
+        self.status_last_seen.append(0.0)
+        self.control_last_seen.append(0.0)
+        self.msg_count.append(0)
+        self.labels.append("")
+        self.last_status.append(None)
+        return slot
+
+    def add_arb_id(self, arb_id: int) -> int:
+        """
+        NAME
+            add_arb_id - Allocate (or find) the slot for a frame's device.
+        """
+        return self.add((arb_id >> 16) & 0xFF, (arb_id >> 24) & 0x1F, arb_id & 0x3F)
+
+    def add_devices(self, devices: Iterable[Dict[str, Any]]) -> None:
+        """
+        NAME
+            add_devices - Pre-allocate slots and labels for profile devices.
+        """
+        for spec in devices:
+            slot = self.add(int(spec["manufacturer"]), int(spec["device_type"]), int(spec["device_id"]))
+            label = str(spec.get("label", "")).strip()
+            if label:
+                self.labels[slot] = label
+        self.known_count = len(self.keys)
+
+    def seen_keys(self) -> List[Tuple[int, int, int]]:
+        """
+        NAME
+            seen_keys - Return (manufacturer, type, id) for devices with traffic.
+        """
+        return [key for key, count in zip(self.keys, self.msg_count) if count]
+
+    def seen_counts(self) -> Tuple[int, int]:
+        """
+        NAME
+            seen_counts - Count devices with traffic, and how many are unprofiled.
+
+        RETURNS
+            (seen_devices, unknown_devices).
+        """
+        msg_count = self.msg_count
+        known = self.known_count
+        unknown = sum(1 for slot in range(known, len(msg_count)) if msg_count[slot])
+        seen = unknown + sum(1 for slot in range(known) if msg_count[slot])
+        return seen, unknown
+
+
+PairKey = Tuple[int, int, int, int, int]
+
+
+class PairTable:
+    """
+    NAME
+        PairTable - Per-(device, API) frame counters stored as parallel arrays.
+
+    DESCRIPTION
+        Same layout as DeviceTable, keyed by (manufacturer, type, id,
+        api_class, api_index). The per-frame path stores into the last and
+        count arrays by slot; as_stats() rebuilds the dict form used by the
+        API inventory dump.
+    """
+    def __init__(self) -> None:
+        self.slot_of: Dict[PairKey, int] = {}
+        self.keys: List[PairKey] = []
+        self.arb_ids: List[int] = []
+        self.first = array("d")
+        self.last = array("d")
+        self.count = array("q")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: PairKey, arb_id: int, now: float) -> int:
+        """
+        NAME
+            add - Return the slot for a pair, allocating it if needed.
+
+        PARAMETERS
+            key: (manufacturer, type, id, api_class, api_index).
+            arb_id: Arbitration ID recorded for a new pair.
+            now: First-seen time recorded for a new pair.
+        """
+        slot = self.slot_of.get(key)
+        if slot is not None:
+            return slot
+        slot = len(self.keys)
+        self.slot_of[key] = slot
+        self.keys.append(key)
+        self.arb_ids.append(arb_id)
+        self.first.append(now)
+        self.last.append(now)
+        self.count.append(0)
+        return slot
+
+    def as_stats(self) -> Dict[PairKey, Dict[str, float]]:
+        """
+        NAME
+            as_stats - Return pair counters as {key: {first, last, count, arb_id}}.
+        """
+        return {
+            key: {
+                "first": self.first[slot],
+                "last": self.last[slot],
+                "count": float(self.count[slot]),
+                "arb_id": self.arb_ids[slot],
+            }
+            for slot, key in enumerate(self.keys)
+        }
 
 
 @dataclass
@@ -26,31 +230,31 @@ class SnifferState:
         Holds per-device timestamps, message counts, and error totals used by
         reporting and publishing.
     """
-    last_seen: Dict[Tuple[int, int, int], float] = field(default_factory=dict)
-    status_last_seen: Dict[Tuple[int, int, int], float] = field(default_factory=dict)
-    control_last_seen: Dict[Tuple[int, int, int], float] = field(default_factory=dict)
-    msg_count: Dict[Tuple[int, int, int], int] = field(default_factory=dict)
-    pair_stats: Dict[Tuple[int, int, int, int, int], Dict[str, float]] = field(default_factory=dict)
-    last_status: Dict[Tuple[int, int, int], str] = field(default_factory=dict)
+    device_table: DeviceTable = field(default_factory=DeviceTable)
+    pair_table: PairTable = field(default_factory=PairTable)
     total_frames: int = 0
     period_frames: int = 0
     read_errors: int = 0
+    rx_dropped: int = 0
     pcap_errors: int = 0
     last_frame_time: float = 0.0
     heartbeat: int = 0
     open_ok: bool = True
     marker_counter: int = 0
     last_marker_ts: float = 0.0
+    # time.time() - time.monotonic(); loop timestamps are monotonic and are
+    # shifted by this offset only where wall-clock time is shown or logged.
+    wall_offset: float = 0.0
 
 
-def merge_unknown_devices(devices, last_seen: Dict[Tuple[int, int, int], float], enabled: bool):
+def merge_unknown_devices(devices, device_table: DeviceTable, enabled: bool):
     """
     NAME
         merge_unknown_devices - Optionally include unprofiled devices.
 
     PARAMETERS
         devices: Profile device list.
-        last_seen: Map of observed devices to last-seen timestamps.
+        device_table: Per-device counters for observed devices.
         enabled: Whether to add unknown entries.
 
     RETURNS
@@ -60,7 +264,7 @@ def merge_unknown_devices(devices, last_seen: Dict[Tuple[int, int, int], float],
         return devices
     known_keys = {(d["manufacturer"], d["device_type"], d["device_id"]) for d in devices}
     merged = list(devices)
-    for key in last_seen.keys():
+    for key in device_table.seen_keys():
         if key in known_keys:
             continue
         mfg, dtype, did = key